@@ -248,7 +248,9 @@ class DatabaseService:
         """Get user by ID"""
         try:
             with self.session_scope() as session:
-                return session.query(User).filter(User.id == user_id, User.is_active == True).first()
+                # session.get checks the identity map before compiling a query
+                user = session.get(User, user_id)
+                return user if user is not None and user.is_active else None
         except Exception as e:
             logger.error(f"Failed to get user by ID: {e}")
             return None
@@ -257,7 +259,7 @@ class DatabaseService:
         """Update user fields"""
         try:
             with self.session_scope() as session:
-                user = session.query(User).filter(User.id == user_id).first()
+                user = session.get(User, user_id)
                 if user:
                     for key, value in updates.items():
                         if hasattr(user, key):
@@ -8,7 +8,7 @@ from .coral_client import coral_client, CoralProtocolClient
 from .solana_payments import solana_payment_service, SolanaPaymentService
 from .agent_communication import agent_communication, AgentCommunicationProtocol
 from .multi_agent_orchestrator import multi_agent_orchestrator, MultiAgentOrchestrator
-from .rentable_agents import rentable_agent_marketplace, RentableAgentMarketplace
+from .rentable_agents import get_marketplace, RentableAgentMarketplace
 from .coral_studio_integration import coral_studio, CoralStudioIntegration
 from .composable_agents import composable_agent_system, ComposableAgentSystem
 
@@ -22,7 +22,7 @@ def initialize_coral_integration():
     """Initialize the complete Coral Protocol integration"""
     
     # Initialize dependencies
-    global multi_agent_orchestrator, composable_agent_system, rentable_agent_marketplace
+    global multi_agent_orchestrator, composable_agent_system
     
     # Set up communication protocol
     multi_agent_orchestrator.communication = agent_communication
@@ -32,7 +32,7 @@ def initialize_coral_integration():
     composable_agent_system.orchestrator = multi_agent_orchestrator
     
     # Set up marketplace
-    rentable_agent_marketplace.payment_service = solana_payment_service
+    marketplace = get_marketplace(solana_payment_service)
     
     # Register CoreSense agents
     coresense_registry.register_all_agents()
@@ -43,7 +43,7 @@ def initialize_coral_integration():
         "payments": solana_payment_service,
         "communication": agent_communication,
         "orchestrator": multi_agent_orchestrator,
-        "marketplace": rentable_agent_marketplace,
+        "marketplace": marketplace,
         "studio": coral_studio,
         "composable": composable_agent_system
     }
@@ -55,7 +55,7 @@ __all__ = [
     "solana_payment_service",
     "agent_communication",
     "multi_agent_orchestrator",
-    "rentable_agent_marketplace",
+    "get_marketplace",
     "coral_studio",
     "composable_agent_system",
     "initialize_coral_integration"
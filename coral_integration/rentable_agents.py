@@ -568,5 +568,18 @@ class RentableAgentMarketplace:
             "platform_fee": total_revenue * 0.3       # 30% platform fee
         }
 
-# Global marketplace instance
-rentable_agent_marketplace = RentableAgentMarketplace(None)  # Will be initialized with payment service
\ No newline at end of file
+# Global marketplace instance, built lazily on first access
+_marketplace_singleton: Optional[RentableAgentMarketplace] = None
+
+def get_marketplace(payment_service: Optional[SolanaPaymentService] = None) -> RentableAgentMarketplace:
+    """Get the global marketplace, creating it on first call"""
+    global _marketplace_singleton
+    if _marketplace_singleton is None:
+        _marketplace_singleton = RentableAgentMarketplace(payment_service)
+    elif payment_service is not None and _marketplace_singleton.payment_service is None:
+        _marketplace_singleton.payment_service = payment_service
+    return _marketplace_singleton
+
+def _peek() -> Optional[RentableAgentMarketplace]:
+    """Return the global marketplace without creating it"""
+    return _marketplace_singleton
@@ -4,20 +4,57 @@ Handles cryptocurrency payments through Solana blockchain
 """
 
 import asyncio
+import itertools
 import json
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
 
-@dataclass
+# Solana JSON-RPC endpoint; when unset, verification is simulated
+SOLANA_RPC_URL = os.getenv("SOLANA_RPC_URL", "")
+LAMPORTS_PER_SOL = 1_000_000_000
+
+# Shared RPC client, created on first use so connections are kept alive across verifications
+_rpc_client = None
+
+
+def _get_rpc_client():
+    """Get the shared keep-alive HTTP client for Solana RPC calls"""
+    global _rpc_client
+    if _rpc_client is None:
+        import httpx
+        
+        _rpc_client = httpx.AsyncClient(
+            base_url=SOLANA_RPC_URL,
+            http2=True,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+    return _rpc_client
+
+
+async def close_rpc_client():
+    """Close the shared Solana RPC client; SolanaPaymentService.shutdown() calls this"""
+    global _rpc_client
+    if _rpc_client is not None:
+        await _rpc_client.aclose()
+        _rpc_client = None
+
+
+@dataclass(slots=True)
 class SolanaWallet:
     """Represents a Solana wallet configuration"""
     public_key: str
     private_key: Optional[str] = None  # Never log or expose this
     network: str = "mainnet-beta"
     
-@dataclass
+@dataclass(slots=True)
 class PaymentPlan:
     """Represents a CoreSense payment plan"""
     plan_id: str
@@ -27,8 +64,23 @@ class PaymentPlan:
     duration_days: int
     features: List[str]
     agent_access: List[str]
+    _features_tuple: tuple = field(init=False, repr=False, compare=False)
+    _agent_access_tuple: tuple = field(init=False, repr=False, compare=False)
+    _plan_details: Dict[str, Any] = field(init=False, repr=False, compare=False)
+    _per_agent_factor: float = field(init=False, default=0.0, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Plans are immutable, so build the response payload once; callers get a shallow copy
+        self._features_tuple = tuple(self.features)
+        self._agent_access_tuple = tuple(self.agent_access)
+        self._plan_details = {
+            "name": self.name,
+            "features": self._features_tuple,
+            "duration_days": self.duration_days,
+            "agent_access": self._agent_access_tuple
+        }
 
-@dataclass
+@dataclass(slots=True)
 class PaymentTransaction:
     """Represents a payment transaction"""
     transaction_id: str
@@ -41,13 +93,172 @@ class PaymentTransaction:
     created_at: datetime
     confirmed_at: Optional[datetime] = None
     transaction_hash: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    _created_at_iso: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._created_at_iso = self.created_at.isoformat()
+
+class TransactionStore:
+    """
+    SQLite-backed store for payment transactions
+    
+    Calls block, so async code runs them through asyncio.to_thread; a lock
+    serializes them on the shared connection.
+    """
+    
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS transactions (
+            transaction_id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL,
+            plan_id TEXT NOT NULL,
+            amount_sol REAL NOT NULL,
+            amount_usd REAL NOT NULL,
+            wallet_address TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            confirmed_at TEXT,
+            expires_at TEXT,
+            transaction_hash TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_user ON transactions(user_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_status_plan ON transactions(status, plan_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tx_hash ON transactions(transaction_hash)",
+    )
+    
+    _COLUMNS = (
+        "transaction_id, user_id, plan_id, amount_sol, amount_usd, wallet_address, "
+        "status, created_at, confirmed_at, expires_at, transaction_hash"
+    )
+    
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+    
+    def add(self, transaction: PaymentTransaction):
+        """Persist a new transaction"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO transactions (transaction_id, user_id, plan_id, amount_sol, amount_usd, "
+                "wallet_address, status, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (transaction.transaction_id, transaction.user_id, transaction.plan_id,
+                 transaction.amount_sol, transaction.amount_usd, transaction.wallet_address,
+                 transaction.status, transaction._created_at_iso)
+            )
+    
+    def update_status(self, transaction: PaymentTransaction):
+        """Persist status, confirmation and expiry changes of a transaction"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE transactions SET status = ?, confirmed_at = ?, expires_at = ?, transaction_hash = ? "
+                "WHERE transaction_id = ?",
+                (transaction.status,
+                 transaction.confirmed_at.isoformat() if transaction.confirmed_at else None,
+                 transaction.expires_at.isoformat() if transaction.expires_at else None,
+                 transaction.transaction_hash, transaction.transaction_id)
+            )
+    
+    def user_history(self, user_id: str, limit: Optional[int] = None) -> List[tuple]:
+        """Get a user's transactions, newest first"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT transaction_id, plan_id, amount_sol, amount_usd, status, created_at, "
+                "confirmed_at, transaction_hash FROM transactions WHERE user_id = ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (user_id, limit if limit is not None else -1)
+            ).fetchall()
+    
+    def transaction_for_hash(self, transaction_hash: str) -> Optional[str]:
+        """Get the id of the transaction a blockchain hash was recorded for, if any"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT transaction_id FROM transactions WHERE transaction_hash = ? LIMIT 1",
+                (transaction_hash,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def get(self, transaction_id: str) -> Optional[PaymentTransaction]:
+        """Get a transaction by id"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM transactions WHERE transaction_id = ?",
+                (transaction_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+    
+    def load_working_set(self, now: datetime, pending_since: datetime) -> List[PaymentTransaction]:
+        """Get pending transactions created after pending_since and confirmed ones that have not expired yet"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM transactions "
+                "WHERE (status = 'pending' AND created_at > ?) OR (status = 'confirmed' AND expires_at > ?) "
+                "ORDER BY created_at",
+                (pending_since.isoformat(), now.isoformat())
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+    
+    @staticmethod
+    def _from_row(row: tuple) -> PaymentTransaction:
+        """Build a transaction from a row selected with _COLUMNS"""
+        (transaction_id, user_id, plan_id, amount_sol, amount_usd, wallet_address,
+         status, created_at, confirmed_at, expires_at, transaction_hash) = row
+        return PaymentTransaction(
+            transaction_id=transaction_id,
+            user_id=user_id,
+            plan_id=plan_id,
+            amount_sol=amount_sol,
+            amount_usd=amount_usd,
+            wallet_address=wallet_address,
+            status=status,
+            created_at=datetime.fromisoformat(created_at),
+            confirmed_at=datetime.fromisoformat(confirmed_at) if confirmed_at else None,
+            transaction_hash=transaction_hash,
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None
+        )
+    
+    def confirmed_totals_by_plan(self, plan_ids: List[str]) -> List[tuple]:
+        """Get (plan_id, count, total_sol) of confirmed transactions for the given plans"""
+        if not plan_ids:
+            return []
+        placeholders = ", ".join("?" * len(plan_ids))
+        with self._lock:
+            return self._conn.execute(
+                "SELECT plan_id, COUNT(*), SUM(amount_sol) FROM transactions "
+                f"WHERE status = 'confirmed' AND plan_id IN ({placeholders}) GROUP BY plan_id",
+                plan_ids
+            ).fetchall()
+    
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
 
 class SolanaPaymentService:
     """Service for handling Solana payments for CoreSense premium features"""
     
+    logger = logging.getLogger(__name__)
+    
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.sol_to_usd_rate = 23.50  # Approximate SOL price - would fetch from API in production
+        self.sol_to_usd_rate = 23.50  # Last known SOL price, used until a live quote is fetched
+        self.price_api_url = os.getenv("SOL_PRICE_API_URL", "")
+        self.rate_ttl_seconds = 60.0
+        self._rate_cache: Tuple[float, float] = (0.0, 0.0)  # (value, expiry monotonic ts)
+        self._rate_lock = asyncio.Lock()
+        
+        # Caps concurrent Solana RPC verifications during bulk checks
+        self._verify_semaphore = asyncio.Semaphore(16)
+        
+        # Revenue sharing model: agents get 70% of subscription revenue
+        self.revenue_share = 0.70
+        self._earnings_cache: Optional[Dict[str, Dict[str, Any]]] = None
         
         # CoreSense payment plans
         self.payment_plans = {
@@ -102,25 +313,134 @@ class SolanaPaymentService:
             )
         }
         
+        # Each agent in a plan gets an equal slice of the revenue share
+        for plan in self.payment_plans.values():
+            plan._per_agent_factor = self.revenue_share / len(plan.agent_access)
+        
         # CoreSense treasury wallet (simulation)
         self.treasury_wallet = SolanaWallet(
             public_key="CoreSenseTreasuryWalletPublicKeyHere123456789",
             network="mainnet-beta"
         )
         
+        # Durable transaction store; history and earnings are answered from it
+        self.store = TransactionStore(os.getenv("PAYMENTS_DB_PATH") or ":memory:")
+        
+        # In-memory working set for verification and subscription checks. Payment
+        # requests go stale after pending_ttl and subscriptions at expires_at; both
+        # are then swept out and only kept in the store.
         self.transactions = {}
+        self._seq = itertools.count()
+        self.pending_ttl = timedelta(minutes=15)
+        self.sweep_interval_seconds = 60.0
+        self._next_sweep = 0.0
+        
+        # Confirmed transactions per user, for subscription lookups without a full scan
+        self._confirmed_tx_ids: set = set()
+        self._confirmed_by_user: Dict[str, List[str]] = defaultdict(list)
+        
+        # Blockchain hash -> the transaction it was claimed or confirmed for
+        self._tx_by_hash: Dict[str, str] = {}
+        
+        # Active subscription per user: (expires_at, subscription details)
+        self._active_sub_cache: Dict[str, Tuple[datetime, Dict[str, Any]]] = {}
+        
+        # A file-backed store outlives the process, so pick up where it left off
+        now = datetime.now()
+        for transaction in self.store.load_working_set(now, now - self.pending_ttl):
+            self._index_transaction(transaction)
+    
+    def _index_transaction(self, transaction: PaymentTransaction):
+        """Add a transaction to the in-memory working set and its indexes"""
+        if time.monotonic() >= self._next_sweep:
+            self._evict_stale(datetime.now())
+        self.transactions[transaction.transaction_id] = transaction
+        if transaction.status == "confirmed":
+            self._index_confirmed(transaction)
+    
+    def _index_confirmed(self, transaction: PaymentTransaction):
+        """Index a confirmed transaction for hash and subscription lookups"""
+        transaction_id = transaction.transaction_id
+        if transaction_id in self._confirmed_tx_ids:
+            return
+        self._confirmed_tx_ids.add(transaction_id)
+        self._tx_by_hash[transaction.transaction_hash] = transaction_id
+        self._confirmed_by_user[transaction.user_id].append(transaction_id)
+    
+    def _evict_stale(self, now: datetime):
+        """Drop stale payment requests and expired subscriptions from the working set"""
+        self._next_sweep = time.monotonic() + self.sweep_interval_seconds
+        stale_before = now - self.pending_ttl
+        evicted = [
+            transaction for transaction in self.transactions.values()
+            if (transaction.status == "pending" and transaction.created_at <= stale_before)
+            or (transaction.status == "confirmed" and transaction.expires_at is not None
+                and transaction.expires_at <= now)
+        ]
+        
+        for transaction in evicted:
+            transaction_id = transaction.transaction_id
+            del self.transactions[transaction_id]
+            if transaction_id not in self._confirmed_tx_ids:
+                continue
+            # The store still answers hash lookups, so replays stay rejected
+            self._confirmed_tx_ids.discard(transaction_id)
+            if self._tx_by_hash.get(transaction.transaction_hash) == transaction_id:
+                del self._tx_by_hash[transaction.transaction_hash]
+            user_tx_ids = self._confirmed_by_user[transaction.user_id]
+            user_tx_ids.remove(transaction_id)
+            if not user_tx_ids:
+                del self._confirmed_by_user[transaction.user_id]
+        
+        for user_id in [user_id for user_id, (expiry, _) in self._active_sub_cache.items() if expiry <= now]:
+            del self._active_sub_cache[user_id]
+    
+    async def shutdown(self):
+        """Close the Solana RPC client and the transaction store"""
+        await close_rpc_client()
+        await asyncio.to_thread(self.store.close)
     
     def get_payment_plans(self) -> Dict[str, PaymentPlan]:
         """Get all available payment plans"""
         return self.payment_plans
     
-    def calculate_sol_price(self, usd_amount: float) -> float:
+    async def _get_rate(self) -> float:
+        """Get the SOL/USD rate, sharing one fetch per TTL window"""
+        value, expiry = self._rate_cache
+        if time.monotonic() < expiry:
+            return value
+        
+        async with self._rate_lock:
+            # Another task may have refreshed the rate while we waited
+            value, expiry = self._rate_cache
+            if time.monotonic() < expiry:
+                return value
+            
+            if self.price_api_url:
+                try:
+                    self.sol_to_usd_rate = await self._fetch_rate()
+                except Exception as e:
+                    self.logger.warning("Failed to fetch SOL price, using last known rate: %s", e)
+            
+            self._rate_cache = (self.sol_to_usd_rate, time.monotonic() + self.rate_ttl_seconds)
+            return self.sol_to_usd_rate
+    
+    async def _fetch_rate(self) -> float:
+        """Fetch the current SOL/USD rate from the configured price API"""
+        import httpx
+        
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(self.price_api_url)
+            response.raise_for_status()
+            return float(response.json()["solana"]["usd"])
+    
+    async def calculate_sol_price(self, usd_amount: float) -> float:
         """Calculate SOL amount from USD"""
-        return round(usd_amount / self.sol_to_usd_rate, 6)
+        return round(usd_amount / await self._get_rate(), 6)
     
-    def calculate_usd_price(self, sol_amount: float) -> float:
+    async def calculate_usd_price(self, sol_amount: float) -> float:
         """Calculate USD amount from SOL"""
-        return round(sol_amount * self.sol_to_usd_rate, 2)
+        return round(sol_amount * await self._get_rate(), 2)
     
     async def create_payment_request(self, 
                                    user_id: str, 
@@ -132,7 +452,8 @@ class SolanaPaymentService:
                 return {"success": False, "error": "Invalid payment plan"}
             
             plan = self.payment_plans[plan_id]
-            transaction_id = f"coresense_{user_id}_{plan_id}_{datetime.now().timestamp()}"
+            now = datetime.now()
+            transaction_id = f"coresense_{user_id}_{plan_id}_{time.time_ns()}_{next(self._seq)}"
             
             # Create payment transaction
             transaction = PaymentTransaction(
@@ -143,10 +464,13 @@ class SolanaPaymentService:
                 amount_usd=plan.price_usd,
                 wallet_address=user_wallet,
                 status="pending",
-                created_at=datetime.now()
+                created_at=now
             )
             
-            self.transactions[transaction_id] = transaction
+            await asyncio.to_thread(self.store.add, transaction)
+            self._index_transaction(transaction)
+            
+            payment_url = self._generate_qr_data(plan.price_sol, transaction_id)
             
             # Create Solana payment request
             payment_request = {
@@ -156,53 +480,76 @@ class SolanaPaymentService:
                     "recipient": self.treasury_wallet.public_key,
                     "amount": plan.price_sol,
                     "currency": "SOL",
-                    "memo": f"CoreSense {plan.name} subscription",
-                    "expires_at": (datetime.now() + timedelta(minutes=15)).isoformat()
-                },
-                "plan_details": {
-                    "name": plan.name,
-                    "features": plan.features,
-                    "duration_days": plan.duration_days,
-                    "agent_access": plan.agent_access
+                    "memo": self._payment_memo(transaction_id),
+                    "expires_at": (now + self.pending_ttl).isoformat()
                 },
-                "qr_code_data": self._generate_qr_data(plan.price_sol, transaction_id),
-                "payment_url": f"solana:{self.treasury_wallet.public_key}?amount={plan.price_sol}&memo=CoreSense-{transaction_id}"
+                "plan_details": dict(plan._plan_details),
+                "qr_code_data": payment_url,
+                "payment_url": payment_url
             }
             
-            self.logger.info(f"Payment request created for user {user_id}, plan {plan_id}")
+            self.logger.info("Payment request created for user %s, plan %s", user_id, plan_id)
             return payment_request
             
         except Exception as e:
-            self.logger.error(f"Failed to create payment request: {e}")
+            self.logger.error("Failed to create payment request: %s", e)
             return {"success": False, "error": str(e)}
     
+    @staticmethod
+    def _payment_memo(transaction_id: str) -> str:
+        """Memo the payer attaches so the on-chain transfer can be tied to transaction_id"""
+        return f"CoreSense-{transaction_id}"
+    
     def _generate_qr_data(self, amount: float, transaction_id: str) -> str:
         """Generate QR code data for payment"""
-        return f"solana:{self.treasury_wallet.public_key}?amount={amount}&memo=CoreSense-{transaction_id}"
+        return f"solana:{self.treasury_wallet.public_key}?amount={amount}&memo={self._payment_memo(transaction_id)}"
     
     async def verify_payment(self, transaction_id: str, 
                            blockchain_hash: str) -> Dict[str, Any]:
         """Verify a payment transaction on Solana blockchain"""
         try:
-            if transaction_id not in self.transactions:
-                return {"success": False, "error": "Transaction not found"}
+            transaction = self.transactions.get(transaction_id)
+            if transaction is None:
+                # Stale requests and expired subscriptions are only kept in the store
+                transaction = await asyncio.to_thread(self.store.get, transaction_id)
+                if transaction is None:
+                    return {"success": False, "error": "Transaction not found"}
+                transaction = self.transactions.setdefault(transaction_id, transaction)
             
-            transaction = self.transactions[transaction_id]
+            if transaction.transaction_hash not in (None, blockchain_hash):
+                return {"success": False, "error": "Transaction already verified with a different hash"}
             
-            # Simulate blockchain verification
-            # In production, this would query Solana blockchain for the transaction
-            verification_result = await self._simulate_blockchain_verification(
-                blockchain_hash, transaction.amount_sol
-            )
+            # One on-chain payment pays for one transaction. The hash is claimed
+            # before any await so concurrent verifications can't both use it.
+            if self._tx_by_hash.setdefault(blockchain_hash, transaction_id) != transaction_id:
+                return {"success": False, "error": "Blockchain hash already used for another transaction"}
+            
+            try:
+                # Hashes of transactions outside the working set are only in the store
+                bound_to = await asyncio.to_thread(self.store.transaction_for_hash, blockchain_hash)
+                if bound_to not in (None, transaction_id):
+                    self._release_hash(blockchain_hash, transaction)
+                    return {"success": False, "error": "Blockchain hash already used for another transaction"}
+                
+                verification_result = await self._blockchain_verify(
+                    blockchain_hash, transaction.amount_sol, transaction_id
+                )
+            except BaseException:
+                self._release_hash(blockchain_hash, transaction)
+                raise
             
             if verification_result["verified"]:
                 # Update transaction status
                 transaction.status = "confirmed"
                 transaction.confirmed_at = datetime.now()
                 transaction.transaction_hash = blockchain_hash
+                # A sweep during verification may have dropped it from the working set
+                self._index_transaction(transaction)
                 
                 # Activate subscription
                 subscription = await self._activate_subscription(transaction)
+                await asyncio.to_thread(self.store.update_status, transaction)
+                self._earnings_cache = None
                 
                 response = {
                     "success": True,
@@ -213,20 +560,101 @@ class SolanaPaymentService:
                     "confirmed_at": transaction.confirmed_at.isoformat()
                 }
                 
-                self.logger.info(f"Payment verified and subscription activated for transaction {transaction_id}")
+                self.logger.info("Payment verified and subscription activated for transaction %s", transaction_id)
                 return response
             else:
+                self._release_hash(blockchain_hash, transaction)
                 return {"success": False, "error": "Payment verification failed"}
                 
         except Exception as e:
-            self.logger.error(f"Failed to verify payment: {e}")
+            self.logger.error("Failed to verify payment: %s", e)
             return {"success": False, "error": str(e)}
     
+    def _release_hash(self, blockchain_hash: str, transaction: PaymentTransaction):
+        """Drop a hash claim that did not end in a confirmation of transaction"""
+        if (transaction.transaction_hash != blockchain_hash
+                and self._tx_by_hash.get(blockchain_hash) == transaction.transaction_id):
+            del self._tx_by_hash[blockchain_hash]
+    
+    async def verify_payments_bulk(self, batch: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Verify many (transaction_id, blockchain_hash) pairs concurrently"""
+        async def _one(transaction_id: str, blockchain_hash: str) -> Dict[str, Any]:
+            async with self._verify_semaphore:
+                return await self.verify_payment(transaction_id, blockchain_hash)
+        
+        results = await asyncio.gather(*[_one(t, h) for t, h in batch], return_exceptions=True)
+        return [
+            {"success": False, "error": str(result)} if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    async def _blockchain_verify(self, 
+                                 tx_hash: str, 
+                                 expected_amount: float,
+                                 transaction_id: str) -> Dict[str, Any]:
+        """Verify a transaction on the Solana blockchain pays the treasury for transaction_id"""
+        if not SOLANA_RPC_URL:
+            return await self._simulate_blockchain_verification(tx_hash, expected_amount)
+        
+        # Cheap signature lookup first; only finalized transactions are fetched
+        statuses = await self._rpc("getSignatureStatuses", [[tx_hash], {"searchTransactionHistory": True}])
+        status = statuses["value"][0]
+        if not status or status.get("err") or status.get("confirmationStatus") != "finalized":
+            return {"verified": False, "amount": 0.0, "timestamp": datetime.now().isoformat()}
+        
+        # Read only the balance deltas of the transaction, never the enclosing block
+        result = await self._rpc("getTransaction", [
+            tx_hash, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}
+        ])
+        if not result or result["meta"]["err"] is not None:
+            return {"verified": False, "amount": 0.0, "timestamp": datetime.now().isoformat()}
+        
+        account_keys = [key["pubkey"] for key in result["transaction"]["message"]["accountKeys"]]
+        received_lamports = 0
+        if self.treasury_wallet.public_key in account_keys:
+            index = account_keys.index(self.treasury_wallet.public_key)
+            received_lamports = result["meta"]["postBalances"][index] - result["meta"]["preBalances"][index]
+        
+        # Without the memo any large enough transfer to the treasury would verify
+        memo_matched = self._payment_memo(transaction_id) in self._memos(result)
+        
+        return {
+            "verified": memo_matched and received_lamports >= round(expected_amount * LAMPORTS_PER_SOL),
+            "amount": received_lamports / LAMPORTS_PER_SOL,
+            "memo_matched": memo_matched,
+            "slot": result["slot"],
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    @staticmethod
+    def _memos(result: Dict[str, Any]) -> List[str]:
+        """Memo texts of a jsonParsed transaction, including inner instructions"""
+        instructions = list(result["transaction"]["message"]["instructions"])
+        for inner in result["meta"].get("innerInstructions") or ():
+            instructions.extend(inner["instructions"])
+        return [
+            instruction["parsed"] for instruction in instructions
+            if instruction.get("program") == "spl-memo" and isinstance(instruction.get("parsed"), str)
+        ]
+    
+    async def _rpc(self, method: str, params: List[Any]) -> Any:
+        """Issue a Solana JSON-RPC call and return its result"""
+        response = await _get_rpc_client().post("", json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": method,
+            "params": params
+        })
+        response.raise_for_status()
+        payload = response.json()
+        if "error" in payload:
+            raise RuntimeError(f"Solana RPC {method} failed: {payload['error']}")
+        return payload["result"]
+    
     async def _simulate_blockchain_verification(self, 
                                               tx_hash: str, 
                                               expected_amount: float) -> Dict[str, Any]:
         """Simulate blockchain transaction verification"""
-        # In production, this would query actual Solana blockchain
         await asyncio.sleep(0.5)  # Simulate network delay
         
         return {
@@ -240,46 +668,62 @@ class SolanaPaymentService:
     async def _activate_subscription(self, transaction: PaymentTransaction) -> Dict[str, Any]:
         """Activate user subscription after successful payment"""
         plan = self.payment_plans[transaction.plan_id]
+        transaction.expires_at = transaction.confirmed_at + timedelta(days=plan.duration_days)
+        self._cache_active_subscription(transaction, plan)
         
         subscription = {
             "subscription_id": f"sub_{transaction.transaction_id}",
             "user_id": transaction.user_id,
             "plan_id": transaction.plan_id,
             "plan_name": plan.name,
-            "features_enabled": plan.features,
-            "agent_access": plan.agent_access,
-            "activated_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(days=plan.duration_days)).isoformat(),
+            "features_enabled": plan._features_tuple,
+            "agent_access": plan._agent_access_tuple,
+            "activated_at": transaction.confirmed_at.isoformat(),
+            "expires_at": transaction.expires_at.isoformat(),
             "status": "active",
             "payment_transaction": transaction.transaction_id
         }
         
         return subscription
     
+    def _cache_active_subscription(self, transaction: PaymentTransaction, plan: PaymentPlan):
+        """Remember the longest-running active subscription for the transaction's user"""
+        cached = self._active_sub_cache.get(transaction.user_id)
+        if cached and cached[0] >= transaction.expires_at:
+            return
+        
+        self._active_sub_cache[transaction.user_id] = (transaction.expires_at, {
+            "subscription_id": f"sub_{transaction.transaction_id}",
+            "plan_id": transaction.plan_id,
+            "plan_name": plan.name,
+            "features": plan._features_tuple,
+            "agent_access": plan._agent_access_tuple,
+            "expires_at": transaction.expires_at.isoformat(),
+            "status": "active"
+        })
+    
     async def check_subscription_status(self, user_id: str) -> Dict[str, Any]:
         """Check user's subscription status"""
         try:
-            # Find user's active subscription
+            now = datetime.now()
             active_subscription = None
-            for tx_id, transaction in self.transactions.items():
-                if (transaction.user_id == user_id and 
-                    transaction.status == "confirmed"):
-                    
+            cached = self._active_sub_cache.get(user_id)
+            
+            if not cached or cached[0] <= now:
+                # Cache miss or expired entry: rescan the user's transactions
+                self._active_sub_cache.pop(user_id, None)
+                for tx_id in self._confirmed_by_user.get(user_id, ()):
+                    transaction = self.transactions[tx_id]
                     plan = self.payment_plans[transaction.plan_id]
-                    expiry = transaction.confirmed_at + timedelta(days=plan.duration_days)
-                    
-                    if expiry > datetime.now():
-                        active_subscription = {
-                            "subscription_id": f"sub_{tx_id}",
-                            "plan_id": transaction.plan_id,
-                            "plan_name": plan.name,
-                            "features": plan.features,
-                            "agent_access": plan.agent_access,
-                            "expires_at": expiry.isoformat(),
-                            "status": "active",
-                            "days_remaining": (expiry - datetime.now()).days
-                        }
-                        break
+                    if transaction.expires_at is None:
+                        transaction.expires_at = transaction.confirmed_at + timedelta(days=plan.duration_days)
+                    if transaction.expires_at > now:
+                        self._cache_active_subscription(transaction, plan)
+                cached = self._active_sub_cache.get(user_id)
+            
+            if cached:
+                expiry, details = cached
+                active_subscription = dict(details, days_remaining=(expiry - now).days)
             
             if active_subscription:
                 return {"success": True, "subscription": active_subscription}
@@ -287,72 +731,71 @@ class SolanaPaymentService:
                 return {"success": True, "subscription": None, "message": "No active subscription"}
                 
         except Exception as e:
-            self.logger.error(f"Failed to check subscription status: {e}")
+            self.logger.error("Failed to check subscription status: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def get_payment_history(self, user_id: str) -> Dict[str, Any]:
+    async def get_payment_history(self, user_id: str, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get payment history for a user"""
         try:
+            rows = await asyncio.to_thread(self.store.user_history, user_id, limit)
             user_transactions = []
-            for transaction in self.transactions.values():
-                if transaction.user_id == user_id:
-                    plan = self.payment_plans[transaction.plan_id]
-                    user_transactions.append({
-                        "transaction_id": transaction.transaction_id,
-                        "plan_name": plan.name,
-                        "amount_sol": transaction.amount_sol,
-                        "amount_usd": transaction.amount_usd,
-                        "status": transaction.status,
-                        "created_at": transaction.created_at.isoformat(),
-                        "confirmed_at": transaction.confirmed_at.isoformat() if transaction.confirmed_at else None,
-                        "transaction_hash": transaction.transaction_hash
-                    })
+            for (transaction_id, plan_id, amount_sol, amount_usd, status,
+                 created_at, confirmed_at, transaction_hash) in rows:
+                user_transactions.append({
+                    "transaction_id": transaction_id,
+                    "plan_name": self.payment_plans[plan_id].name,
+                    "amount_sol": amount_sol,
+                    "amount_usd": amount_usd,
+                    "status": status,
+                    "created_at": created_at,
+                    "confirmed_at": confirmed_at,
+                    "transaction_hash": transaction_hash
+                })
             
-            return {
-                "success": True,
-                "transactions": sorted(user_transactions, 
-                                     key=lambda x: x["created_at"], 
-                                     reverse=True)
-            }
+            return {"success": True, "transactions": user_transactions}
             
         except Exception as e:
-            self.logger.error(f"Failed to get payment history: {e}")
+            self.logger.error("Failed to get payment history: %s", e)
             return {"success": False, "error": str(e)}
     
     def get_agent_earnings(self, agent_id: str, timeframe: str = "30d") -> Dict[str, Any]:
         """Calculate earnings for an agent from premium subscriptions"""
         try:
-            # Revenue sharing model: agents get 70% of subscription revenue
-            revenue_share = 0.70
-            
-            # Simulate earnings calculation
-            total_subscriptions = 0
-            total_revenue_sol = 0.0
+            if self._earnings_cache is None:
+                self._earnings_cache = self.compute_all_agent_earnings()
             
-            for transaction in self.transactions.values():
-                if transaction.status == "confirmed":
-                    plan = self.payment_plans[transaction.plan_id]
-                    if agent_id in plan.agent_access:
-                        total_subscriptions += 1
-                        # Distribute revenue among agents in the plan
-                        agent_share = transaction.amount_sol / len(plan.agent_access) * revenue_share
-                        total_revenue_sol += agent_share
+            agent_totals = self._earnings_cache.get(agent_id, {"subs": 0, "sol": 0.0})
+            total_revenue_sol = agent_totals["sol"]
             
             earnings = {
                 "agent_id": agent_id,
                 "timeframe": timeframe,
-                "total_subscriptions": total_subscriptions,
+                "total_subscriptions": agent_totals["subs"],
                 "revenue_sol": round(total_revenue_sol, 6),
                 "revenue_usd": round(total_revenue_sol * self.sol_to_usd_rate, 2),
-                "revenue_share_percentage": revenue_share * 100,
+                "revenue_share_percentage": self.revenue_share * 100,
                 "calculated_at": datetime.now().isoformat()
             }
             
             return {"success": True, "earnings": earnings}
             
         except Exception as e:
-            self.logger.error(f"Failed to calculate agent earnings: {e}")
+            self.logger.error("Failed to calculate agent earnings: %s", e)
             return {"success": False, "error": str(e)}
 
+    def compute_all_agent_earnings(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate subscription count and SOL revenue share for every agent in one pass"""
+        earnings = defaultdict(lambda: {"subs": 0, "sol": 0.0})
+        
+        for plan_id, count, amount_sol in self.store.confirmed_totals_by_plan(list(self.payment_plans)):
+            plan = self.payment_plans[plan_id]
+            # Distribute revenue among agents in the plan
+            share = amount_sol * plan._per_agent_factor
+            for agent in plan.agent_access:
+                earnings[agent]["subs"] += count
+                earnings[agent]["sol"] += share
+        
+        return dict(earnings)
+
 # Global payment service instance
 solana_payment_service = SolanaPaymentService()
\ No newline at end of file
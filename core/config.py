@@ -4,12 +4,23 @@ Centralized configuration with environment variable handling and validation
 """
 
 import os
-from typing import Dict, Any, Optional, List
+from functools import cache
+from typing import Dict, Any, List, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+def _env_bool(env: Mapping[str, str], key: str, default: str) -> bool:
+    """Read a 'true'/'false' environment flag"""
+    return env.get(key, default).lower() == 'true'
+
+
+def _env_int(env: Mapping[str, str], key: str, default: str) -> int:
+    """Read an integer environment value"""
+    return int(env.get(key, default))
+
+
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database configuration settings"""
     url: str = "sqlite:///./coresense.db"
@@ -20,7 +31,7 @@ class DatabaseConfig:
     echo: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecurityConfig:
     """Security and authentication configuration"""
     jwt_secret_key: str = "change-me-in-production"
@@ -32,7 +43,7 @@ class SecurityConfig:
     password_min_length: int = 8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailConfig:
     """Email configuration settings"""
     smtp_server: str = "smtp.gmail.com"
@@ -44,7 +55,7 @@ class EmailConfig:
     from_name: str = "CoreSense AI"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Main application configuration"""
     
@@ -84,52 +95,54 @@ class AppConfig:
             from dotenv import load_dotenv
             load_dotenv(env_file)
         
+        env = os.environ
+        
         # Database config
         database = DatabaseConfig(
-            url=os.getenv('DATABASE_URL', 'sqlite:///./coresense.db'),
-            pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
-            max_overflow=int(os.getenv('DB_MAX_OVERFLOW', '20')),
-            pool_timeout=int(os.getenv('DB_POOL_TIMEOUT', '30')),
-            pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '3600')),
-            echo=os.getenv('DB_ECHO', 'false').lower() == 'true'
+            url=env.get('DATABASE_URL', 'sqlite:///./coresense.db'),
+            pool_size=_env_int(env, 'DB_POOL_SIZE', '10'),
+            max_overflow=_env_int(env, 'DB_MAX_OVERFLOW', '20'),
+            pool_timeout=_env_int(env, 'DB_POOL_TIMEOUT', '30'),
+            pool_recycle=_env_int(env, 'DB_POOL_RECYCLE', '3600'),
+            echo=_env_bool(env, 'DB_ECHO', 'false')
         )
         
         # Security config
         security = SecurityConfig(
-            jwt_secret_key=os.getenv('JWT_SECRET_KEY', 'change-me-in-production'),
-            jwt_access_token_expire_minutes=int(os.getenv('JWT_ACCESS_TOKEN_EXPIRE_MINUTES', '30')),
-            jwt_refresh_token_expire_days=int(os.getenv('JWT_REFRESH_TOKEN_EXPIRE_DAYS', '7')),
-            session_expire_hours=int(os.getenv('SESSION_EXPIRE_HOURS', '24')),
-            max_login_attempts=int(os.getenv('MAX_LOGIN_ATTEMPTS', '5')),
-            lockout_duration_minutes=int(os.getenv('LOCKOUT_DURATION_MINUTES', '30')),
-            password_min_length=int(os.getenv('PASSWORD_MIN_LENGTH', '8'))
+            jwt_secret_key=env.get('JWT_SECRET_KEY', 'change-me-in-production'),
+            jwt_access_token_expire_minutes=_env_int(env, 'JWT_ACCESS_TOKEN_EXPIRE_MINUTES', '30'),
+            jwt_refresh_token_expire_days=_env_int(env, 'JWT_REFRESH_TOKEN_EXPIRE_DAYS', '7'),
+            session_expire_hours=_env_int(env, 'SESSION_EXPIRE_HOURS', '24'),
+            max_login_attempts=_env_int(env, 'MAX_LOGIN_ATTEMPTS', '5'),
+            lockout_duration_minutes=_env_int(env, 'LOCKOUT_DURATION_MINUTES', '30'),
+            password_min_length=_env_int(env, 'PASSWORD_MIN_LENGTH', '8')
         )
         
         # Email config
         email = EmailConfig(
-            smtp_server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
-            smtp_port=int(os.getenv('SMTP_PORT', '587')),
-            smtp_username=os.getenv('SMTP_USERNAME', ''),
-            smtp_password=os.getenv('SMTP_PASSWORD', ''),
-            smtp_use_tls=os.getenv('SMTP_USE_TLS', 'true').lower() == 'true',
-            from_email=os.getenv('FROM_EMAIL', 'noreply@coresense.ai'),
-            from_name=os.getenv('FROM_NAME', 'CoreSense AI')
+            smtp_server=env.get('SMTP_SERVER', 'smtp.gmail.com'),
+            smtp_port=_env_int(env, 'SMTP_PORT', '587'),
+            smtp_username=env.get('SMTP_USERNAME', ''),
+            smtp_password=env.get('SMTP_PASSWORD', ''),
+            smtp_use_tls=_env_bool(env, 'SMTP_USE_TLS', 'true'),
+            from_email=env.get('FROM_EMAIL', 'noreply@coresense.ai'),
+            from_name=env.get('FROM_NAME', 'CoreSense AI')
         )
         
         return cls(
-            environment=os.getenv('ENVIRONMENT', 'development'),
-            debug=os.getenv('DEBUG', 'true').lower() == 'true',
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            host=os.getenv('HOST', '0.0.0.0'),
-            port=int(os.getenv('PORT', '8501')),
-            enable_auth=os.getenv('ENABLE_AUTH', 'true').lower() == 'true',
-            enable_sensors=os.getenv('ENABLE_SENSORS', 'true').lower() == 'true',
-            enable_agents=os.getenv('ENABLE_AGENTS', 'true').lower() == 'true',
-            enable_metrics=os.getenv('ENABLE_METRICS', 'false').lower() == 'true',
+            environment=env.get('ENVIRONMENT', 'development'),
+            debug=_env_bool(env, 'DEBUG', 'true'),
+            log_level=env.get('LOG_LEVEL', 'INFO'),
+            host=env.get('HOST', '0.0.0.0'),
+            port=_env_int(env, 'PORT', '8501'),
+            enable_auth=_env_bool(env, 'ENABLE_AUTH', 'true'),
+            enable_sensors=_env_bool(env, 'ENABLE_SENSORS', 'true'),
+            enable_agents=_env_bool(env, 'ENABLE_AGENTS', 'true'),
+            enable_metrics=_env_bool(env, 'ENABLE_METRICS', 'false'),
             database=database,
             security=security,
             email=email,
-            openai_api_key=os.getenv('OPENAI_API_KEY', '')
+            openai_api_key=env.get('OPENAI_API_KEY', '')
         )
     
     def validate(self) -> List[str]:
@@ -162,23 +175,16 @@ class AppConfig:
         return self.environment == 'development'
 
 
-# Global configuration instance
-_config: Optional[AppConfig] = None
-
-
+@cache
 def get_config() -> AppConfig:
     """Get the global configuration instance"""
-    global _config
-    if _config is None:
-        _config = AppConfig.from_env()
-    return _config
+    return AppConfig.from_env()
 
 
 def reload_config() -> AppConfig:
     """Reload configuration from environment"""
-    global _config
-    _config = AppConfig.from_env()
-    return _config
+    get_config.cache_clear()
+    return get_config()
 
 
 def validate_config() -> None:
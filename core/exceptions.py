@@ -9,9 +9,9 @@ class CoreSenseError(Exception):
     
     def __init__(self, message: str, code: str = None, details: dict = None):
         self.message = message
-        self.code = code or self.__class__.__name__
-        self.details = details or {}
-        super().__init__(self.message)
+        self.code = code if code is not None else self.__class__.__name__
+        self.details = details if details is not None else {}
+        super().__init__(message)
     
     def __str__(self):
         return f"{self.code}: {self.message}"
@@ -3,11 +3,17 @@ CoreSense AI Platform - Logging Configuration
 Centralized logging setup with proper formatting and levels
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
 
 
 class ColoredFormatter(logging.Formatter):
@@ -22,10 +28,18 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Restore the plain level name so other handlers never see ANSI codes
+        original = record.levelname
+        record.levelname = self._colored.get(original, original)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
 
 
 def setup_logging(
@@ -42,13 +56,18 @@ def setup_logging(
         enable_colors: Enable colored console output
     """
     
+    global _queue_listener
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear existing handlers
+    # Clear existing handlers and stop any previous listener
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
+    
+    handlers = []
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -66,7 +85,7 @@ def setup_logging(
         )
     
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # File handler (if specified)
     if log_file:
@@ -85,7 +104,13 @@ def setup_logging(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_format)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Loggers only enqueue records; console and file I/O happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Set specific logger levels
     logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
@@ -93,6 +118,17 @@ def setup_logging(
     logging.getLogger('httpx').setLevel(logging.WARNING)
 
 
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name
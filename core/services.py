@@ -3,17 +3,23 @@ CoreSense AI Platform - Service Manager
 Centralized service initialization and management
 """
 
-from typing import Dict, Any, Optional, Type
-from dataclasses import dataclass
+import asyncio
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import types
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Type
+from dataclasses import dataclass, replace
 from core.config import get_config
 from core.logging import get_logger
 from core.exceptions import CoreSenseError
-from core.utils import import_module_safely, setup_import_paths
+from core.utils import import_module_safely, prefetch_module_stats, setup_import_paths
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceStatus:
     """Service status information"""
     name: str
@@ -29,6 +35,9 @@ class ServiceManager:
     def __init__(self):
         self.config = get_config()
         self._services: Dict[str, ServiceStatus] = {}
+        # Instances of services that are available and initialized
+        self._ready: Dict[str, Any] = {}
+        self._services_view = types.MappingProxyType(self._services)
         self._setup_paths()
     
     def _setup_paths(self):
@@ -48,7 +57,7 @@ class ServiceManager:
             ServiceStatus object
         """
         try:
-            logger.info(f"Initializing service: {name}")
+            logger.info("Initializing service: %s", name)
             instance = service_class(**kwargs)
             
             # Initialize if it has an initialize method
@@ -65,11 +74,12 @@ class ServiceManager:
             )
             
             self._services[name] = status
-            logger.info(f"✅ Service {name} initialized successfully")
+            self._ready[name] = instance
+            logger.info("✅ Service %s initialized successfully", name)
             return status
             
         except Exception as e:
-            logger.error(f"❌ Failed to initialize service {name}: {e}")
+            logger.error("❌ Failed to initialize service %s: %s", name, e)
             status = ServiceStatus(
                 name=name,
                 available=False,
@@ -77,6 +87,7 @@ class ServiceManager:
                 error=str(e)
             )
             self._services[name] = status
+            self._ready.pop(name, None)
             return status
     
     def register_service_from_module(
@@ -98,8 +109,60 @@ class ServiceManager:
         Returns:
             ServiceStatus object
         """
+        module = import_module_safely(module_path, name + "_module")
+        return self._register_loaded_module(name, module, module_path, class_name, **kwargs)
+    
+    def register_services_from_modules(
+        self,
+        specs: List[Tuple[str, str, str]]
+    ) -> Dict[str, ServiceStatus]:
+        """
+        Register several services whose modules are imported concurrently
+        
+        Module imports run on a thread pool; class lookup and service
+        initialization then happen in order on the calling thread.
+        Set CORESENSE_PARALLEL_IMPORT=0 to import sequentially, in which
+        case the module files are still stat'ed concurrently up front.
+        
+        Args:
+            specs: (name, module_path, class_name) for each service
+            
+        Returns:
+            ServiceStatus objects keyed by service name
+        """
+        if len(specs) <= 1 or os.getenv('CORESENSE_PARALLEL_IMPORT', '1') == '0':
+            stats = prefetch_module_stats([module_path for _, module_path, _ in specs])
+            return {
+                name: self._register_loaded_module(
+                    name,
+                    import_module_safely(module_path, name + "_module", stats),
+                    module_path,
+                    class_name
+                )
+                for name, module_path, class_name in specs
+            }
+        
+        with ThreadPoolExecutor(max_workers=min(6, len(specs))) as pool:
+            futures = [
+                pool.submit(import_module_safely, module_path, name + "_module")
+                for name, module_path, _ in specs
+            ]
+        
+        return {
+            name: self._register_loaded_module(name, future.result(), module_path, class_name)
+            for (name, module_path, class_name), future in zip(specs, futures)
+        }
+    
+    def _register_loaded_module(
+        self,
+        name: str,
+        module: Optional[Any],
+        module_path: str,
+        class_name: str,
+        **kwargs
+    ) -> ServiceStatus:
+        """Register a service from an already imported module"""
         try:
-            module = import_module_safely(module_path, name + "_module")
             if module is None:
                 raise CoreSenseError(f"Could not import module: {module_path}")
             
@@ -110,7 +173,7 @@ class ServiceManager:
             return self.register_service(name, service_class, **kwargs)
             
         except Exception as e:
-            logger.error(f"❌ Failed to register service {name} from module: {e}")
+            logger.error("❌ Failed to register service %s from module: %s", name, e)
             status = ServiceStatus(
                 name=name,
                 available=False,
@@ -118,6 +181,7 @@ class ServiceManager:
                 error=str(e)
             )
             self._services[name] = status
+            self._ready.pop(name, None)
             return status
     
     def get_service(self, name: str) -> Optional[Any]:
@@ -130,10 +194,7 @@ class ServiceManager:
         Returns:
             Service instance or None if not available
         """
-        status = self._services.get(name)
-        if status and status.available and status.initialized:
-            return status.instance
-        return None
+        return self._ready.get(name)
     
     def get_service_status(self, name: str) -> Optional[ServiceStatus]:
         """
@@ -157,17 +218,19 @@ class ServiceManager:
         Returns:
             True if service is available
         """
-        status = self._services.get(name)
-        return status is not None and status.available and status.initialized
+        return name in self._ready
     
-    def get_all_services(self) -> Dict[str, ServiceStatus]:
-        """Get all registered services"""
-        return self._services.copy()
+    def get_all_services(self) -> Mapping[str, ServiceStatus]:
+        """Get a read-only view of all registered services"""
+        return self._services_view
     
     def shutdown_service(self, name: str) -> bool:
         """
         Shutdown a service
         
+        A coroutine returned by the service's shutdown() is awaited: scheduled
+        on the running event loop if there is one, otherwise run to completion.
+        
         Args:
             name: Service name
             
@@ -178,13 +241,19 @@ class ServiceManager:
             status = self._services.get(name)
             if status and status.instance:
                 if hasattr(status.instance, 'shutdown'):
-                    status.instance.shutdown()
-                status.initialized = False
-                logger.info(f"Service {name} shutdown successfully")
+                    result = status.instance.shutdown()
+                    if inspect.iscoroutine(result):
+                        try:
+                            asyncio.get_running_loop().create_task(result)
+                        except RuntimeError:
+                            asyncio.run(result)
+                self._services[name] = replace(status, initialized=False)
+                self._ready.pop(name, None)
+                logger.info("Service %s shutdown successfully", name)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Error shutting down service {name}: {e}")
+            logger.error("Error shutting down service %s: %s", name, e)
             return False
     
     def shutdown_all(self):
@@ -196,14 +265,33 @@ class ServiceManager:
 
 # Global service manager instance
 _service_manager: Optional[ServiceManager] = None
+_service_manager_lock = threading.Lock()
 
 
 def get_service_manager() -> ServiceManager:
     """Get the global service manager instance"""
     global _service_manager
-    if _service_manager is None:
-        _service_manager = ServiceManager()
-    return _service_manager
+    manager = _service_manager
+    if manager is None:
+        # Only the first callers take the lock; one of them builds the manager
+        with _service_manager_lock:
+            if _service_manager is None:
+                _service_manager = ServiceManager()
+            manager = _service_manager
+    return manager
+
+
+# Module-backed services started when agents are enabled:
+# (service name, module path relative to base_dir, class name)
+_AGENT_SPECS = (
+    ('agent_orchestrator', ('agents', 'agent_orchestrator.py'), 'AgentOrchestrator'),
+    ('core_training_agent', ('agents', 'core_training_agent.py'), 'CoreTrainingAgent'),
+    ('fabric_sensor_agent', ('agents', 'fabric_sensor_agent.py'), 'FabricSensorAgent'),
+    # Coral multi-agent orchestrator for advanced workflows
+    ('coral_orchestrator', ('coral_integration', 'multi_agent_orchestrator.py'), 'MultiAgentOrchestrator'),
+    # Agent communication protocol for coral integration
+    ('agent_communication', ('coral_integration', 'agent_communication.py'), 'AgentCommunicationProtocol'),
+)
 
 
 def initialize_core_services() -> ServiceManager:
@@ -216,10 +304,14 @@ def initialize_core_services() -> ServiceManager:
     service_manager = get_service_manager()
     config = get_config()
     
+    enable_auth = config.enable_auth
+    enable_sensors = config.enable_sensors
+    enable_agents = config.enable_agents
+    
     logger.info("🚀 Initializing CoreSense services...")
     
     # Initialize database service if auth is enabled
-    if config.enable_auth:
+    if enable_auth:
         try:
             from auth.database_service import DatabaseService
             service_manager.register_service(
@@ -228,10 +320,10 @@ def initialize_core_services() -> ServiceManager:
                 database_url=config.database.url
             )
         except ImportError as e:
-            logger.warning(f"Database service not available: {e}")
+            logger.warning("Database service not available: %s", e)
     
     # Initialize authentication service
-    if config.enable_auth:
+    if enable_auth:
         try:
             from auth.auth_service import AuthService
             service_manager.register_service(
@@ -239,55 +331,28 @@ def initialize_core_services() -> ServiceManager:
                 AuthService
             )
         except ImportError as e:
-            logger.warning(f"Auth service not available: {e}")
+            logger.warning("Auth service not available: %s", e)
+    
+    # Module-backed services are independent, so their imports run in parallel
+    base = str(config.base_dir)
+    module_specs = []
     
     # Initialize sensor manager if sensors are enabled
-    if config.enable_sensors:
-        service_manager.register_service_from_module(
+    if enable_sensors:
+        module_specs.append((
             'sensor_manager',
-            str(config.base_dir / 'sensors' / '__init__.py'),
+            os.path.join(base, 'sensors', '__init__.py'),
             'SensorFactory'
-        )
+        ))
     
-    # Initialize agent orchestrator if agents are enabled
-    if config.enable_agents:
-        service_manager.register_service_from_module(
-            'agent_orchestrator',
-            str(config.base_dir / 'agents' / 'agent_orchestrator.py'),
-            'AgentOrchestrator'
+    # Initialize agents and coral integration services if agents are enabled
+    if enable_agents:
+        module_specs.extend(
+            (name, os.path.join(base, *parts), class_name)
+            for name, parts, class_name in _AGENT_SPECS
         )
     
-    # Initialize core training agent
-    if config.enable_agents:
-        service_manager.register_service_from_module(
-            'core_training_agent',
-            str(config.base_dir / 'agents' / 'core_training_agent.py'),
-            'CoreTrainingAgent'
-        )
-    
-    # Initialize fabric sensor agent
-    if config.enable_agents:
-        service_manager.register_service_from_module(
-            'fabric_sensor_agent',
-            str(config.base_dir / 'agents' / 'fabric_sensor_agent.py'),
-            'FabricSensorAgent'
-        )
-    
-    # Initialize coral multi-agent orchestrator for advanced workflows
-    if config.enable_agents:
-        service_manager.register_service_from_module(
-            'coral_orchestrator',
-            str(config.base_dir / 'coral_integration' / 'multi_agent_orchestrator.py'),
-            'MultiAgentOrchestrator'
-        )
-    
-    # Initialize agent communication protocol for coral integration
-    if config.enable_agents:
-        service_manager.register_service_from_module(
-            'agent_communication',
-            str(config.base_dir / 'coral_integration' / 'agent_communication.py'),
-            'AgentCommunicationProtocol'
-        )
+    service_manager.register_services_from_modules(module_specs)
     
     logger.info("✅ Core services initialization completed")
     return service_manager
\ No newline at end of file
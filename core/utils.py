@@ -3,9 +3,15 @@ CoreSense AI Platform - Utility Functions
 Shared utility functions for import handling, validation, etc.
 """
 
+import asyncio
+import functools
 import importlib.util
+import json
 import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from core.logging import get_logger
@@ -13,46 +19,121 @@ from core.exceptions import ValidationError, ConfigurationError
 
 logger = get_logger(__name__)
 
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
-def import_module_safely(module_path: str, module_name: str = None) -> Optional[Any]:
+# ASCII and C1 control characters, the non-printable characters seen in practice
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x20), *range(0x7f, 0xa0)])
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Application subdirectories added to sys.path, in insertion order
+_IMPORT_SUBDIRS = ('agents', 'sensors', 'config', 'auth', 'services', 'core')
+
+# Absolute path -> resolved path for paths already handled by add_path_to_sys
+_added_paths: Dict[str, str] = {}
+
+
+def import_module_safely(
+    module_path: str,
+    module_name: str = None,
+    stats: Optional[Dict[str, Optional[str]]] = None
+) -> Optional[Any]:
     """
     Safely import a module from a file path with proper error handling
     
+    Successful imports are memoized per (real path, module name). To
+    re-import after code changes, call clear_module_cache() and remove the
+    module from sys.modules.
+    
     Args:
         module_path: Path to the module file
         module_name: Optional module name (defaults to filename)
+        stats: Optional result of prefetch_module_stats; paths found in it
+            are not stat'ed again
         
     Returns:
         Imported module or None if import fails
     """
     try:
-        if not os.path.exists(module_path):
-            logger.warning(f"Module file not found: {module_path}")
+        if stats is not None and module_path in stats:
+            real_path = stats[module_path]
+        else:
+            real_path = _resolve_module_file(module_path)
+        
+        if real_path is None:
+            logger.warning("Module file not found: %s", module_path)
             return None
         
         if module_name is None:
             module_name = Path(module_path).stem
         
-        spec = importlib.util.spec_from_file_location(module_name, module_path)
-        if spec is None:
-            logger.error(f"Could not create module spec for {module_path}")
-            return None
-        
-        module = importlib.util.module_from_spec(spec)
-        
-        # Add to sys.modules before execution
-        sys.modules[module_name] = module
-        
-        spec.loader.exec_module(module)
-        
-        logger.debug(f"Successfully imported module: {module_name}")
-        return module
+        return _load_module(real_path, module_name)
         
     except Exception as e:
-        logger.error(f"Failed to import module {module_path}: {e}")
+        logger.error("Failed to import module %s: %s", module_path, e)
         return None
 
 
+@functools.lru_cache(maxsize=128)
+def _load_module(module_path: str, module_name: str) -> Any:
+    """Import a module from a resolved file path; failures raise and are not cached"""
+    # Reuse an already-imported module only if it was loaded from this same file
+    existing = sys.modules.get(module_name)
+    existing_file = getattr(existing, '__file__', None)
+    if existing_file is not None and os.path.realpath(existing_file) == module_path:
+        return existing
+    
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None:
+        raise ImportError(f"Could not create module spec for {module_path}")
+    
+    module = importlib.util.module_from_spec(spec)
+    
+    # Add to sys.modules before execution, but never leave a half-initialized module behind
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    
+    logger.debug("Successfully imported module: %s", module_name)
+    return module
+
+
+def clear_module_cache() -> None:
+    """Forget modules memoized by import_module_safely"""
+    _load_module.cache_clear()
+
+
+def _resolve_module_file(module_path: str) -> Optional[str]:
+    """Get the real path of a module file, or None if it does not exist"""
+    if not os.path.exists(module_path):
+        return None
+    return os.path.realpath(module_path)
+
+
+def prefetch_module_stats(paths: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Stat and resolve several module files concurrently
+    
+    Pass the result to import_module_safely so sequential imports skip
+    their own stat calls.
+    
+    Args:
+        paths: Module file paths to check
+        
+    Returns:
+        Mapping of each path to its real path, or None if it does not exist
+    """
+    if len(paths) <= 1:
+        return {path: _resolve_module_file(path) for path in paths}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return dict(zip(paths, pool.map(_resolve_module_file, paths)))
+
+
 def add_path_to_sys(path: Union[str, Path]) -> None:
     """
     Add a path to sys.path if not already present
@@ -60,10 +141,18 @@ def add_path_to_sys(path: Union[str, Path]) -> None:
     Args:
         path: Path to add to sys.path
     """
-    path_str = str(Path(path).resolve())
+    # abspath is cheap next to resolve(), and unlike the raw text it does
+    # not go stale when the working directory changes
+    key = os.path.abspath(path)
+    path_str = _added_paths.get(key)
+    if path_str is not None and path_str in sys.path:
+        return
+    
+    path_str = str(Path(key).resolve())
+    _added_paths[key] = path_str
     if path_str not in sys.path:
         sys.path.insert(0, path_str)
-        logger.debug(f"Added path to sys.path: {path_str}")
+        logger.debug("Added path to sys.path: %s", path_str)
 
 
 def setup_import_paths(base_dir: Path) -> None:
@@ -73,19 +162,19 @@ def setup_import_paths(base_dir: Path) -> None:
     Args:
         base_dir: Base directory of the application
     """
-    paths_to_add = [
-        base_dir,
-        base_dir / 'agents',
-        base_dir / 'sensors', 
-        base_dir / 'config',
-        base_dir / 'auth',
-        base_dir / 'services',
-        base_dir / 'core'
-    ]
+    base = os.path.realpath(base_dir)
     
-    for path in paths_to_add:
-        if path.exists():
-            add_path_to_sys(path)
+    # One directory listing instead of a stat per candidate path
+    try:
+        with os.scandir(base) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return
+    
+    add_path_to_sys(base)
+    for name in _IMPORT_SUBDIRS:
+        if name in present:
+            add_path_to_sys(os.path.join(base, name))
 
 
 def validate_env_vars(required_vars: List[str]) -> None:
@@ -98,11 +187,8 @@ def validate_env_vars(required_vars: List[str]) -> None:
     Raises:
         ConfigurationError: If any required variables are missing
     """
-    missing_vars = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    env = os.environ
+    missing_vars = [var for var in required_vars if not env.get(var)]
     
     if missing_vars:
         raise ConfigurationError(
@@ -146,11 +232,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
     # Remove or replace unsafe characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('_', filename)
     # Remove any remaining non-printable characters
-    filename = ''.join(char for char in filename if char.isprintable())
+    filename = filename.translate(_CONTROL_CHARS_TABLE)
+    if not filename.isprintable():
+        filename = ''.join(char for char in filename if char.isprintable())
     # Limit length
     return filename[:255]
 
@@ -165,11 +252,11 @@ def format_bytes(size: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} PB"
+    if size < 1024:
+        return f"{size:.1f} B"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    index = min((int(size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
 
 
 def safe_json_loads(json_str: str, default: Any = None) -> Any:
@@ -184,10 +271,9 @@ def safe_json_loads(json_str: str, default: Any = None) -> Any:
         Parsed JSON or default value
     """
     try:
-        import json
         return json.loads(json_str)
     except (json.JSONDecodeError, TypeError):
-        logger.warning(f"Failed to parse JSON string: {json_str[:100]}...")
+        logger.warning("Failed to parse JSON string: %.100s...", json_str)
         return default
 
 
@@ -206,8 +292,6 @@ def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
     Raises:
         Last exception if all retries fail
     """
-    import time
-    
     last_exception = None
     
     for attempt in range(max_retries + 1):
@@ -217,14 +301,42 @@ def retry_operation(func, max_retries: int = 3, delay: float = 1.0):
             last_exception = e
             if attempt < max_retries:
                 sleep_time = delay * (2 ** attempt)
-                logger.warning(f"Operation failed (attempt {attempt + 1}), retrying in {sleep_time}s: {e}")
+                logger.warning("Operation failed (attempt %d), retrying in %ss: %s", attempt + 1, sleep_time, e)
                 time.sleep(sleep_time)
             else:
-                logger.error(f"Operation failed after {max_retries + 1} attempts: {e}")
+                logger.error("Operation failed after %d attempts: %s", max_retries + 1, e)
     
     raise last_exception
 
 
+async def aretry_operation(func, max_retries: int = 3, delay: float = 1.0):
+    """
+    Retry a coroutine function with exponential backoff without blocking the event loop
+    
+    Args:
+        func: Coroutine function to retry
+        max_retries: Maximum number of retries
+        delay: Initial delay between retries
+        
+    Returns:
+        Function result
+        
+    Raises:
+        Last exception if all retries fail
+    """
+    delays = [delay * (1 << attempt) for attempt in range(max_retries)]
+    
+    for attempt, sleep_time in enumerate(delays + [None]):
+        try:
+            return await func()
+        except Exception as e:
+            if sleep_time is None:
+                logger.error("Operation failed after %d attempts: %s", max_retries + 1, e)
+                raise
+            logger.warning("Operation failed (attempt %d), retrying in %ss: %s", attempt + 1, sleep_time, e)
+            await asyncio.sleep(sleep_time)
+
+
 def is_valid_email(email: str) -> bool:
     """
     Simple email validation
@@ -235,9 +347,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if email appears valid
     """
-    import re
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 class Timer:
@@ -249,20 +359,18 @@ class Timer:
         self.end_time = None
     
     def __enter__(self):
-        import time
-        self.start_time = time.time()
-        logger.debug(f"Starting: {self.description}")
+        self.start_time = time.perf_counter()
+        logger.debug("Starting: %s", self.description)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
         duration = self.end_time - self.start_time
-        logger.debug(f"Completed: {self.description} in {duration:.2f}s")
+        logger.debug("Completed: %s in %.2fs", self.description, duration)
     
     @property
     def duration(self) -> float:
         """Get the duration in seconds"""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0.0
\ No newline at end of file
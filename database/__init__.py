@@ -3,27 +3,59 @@ CoreSense Database Package
 Complete database management system for CoreSense AI Platform
 """
 
-from .models import (
-    Base, User, UserSession, ExerciseSession, ProgressRecord,
-    AICoachingSession, Subscription, Payment, MuscleActivationPattern,
-    Achievement, UserAchievement,
+import importlib
+import os
+
+# Version information
+__version__ = "1.0.0"
+
+# Public names are imported from their submodule on first access, so importing
+# the package does not pull in SQLAlchemy models or Alembic up front
+_LAZY_EXPORTS = {
+    # Models
+    'Base': 'models', 'User': 'models', 'UserSession': 'models',
+    'ExerciseSession': 'models', 'ProgressRecord': 'models',
+    'AICoachingSession': 'models', 'Subscription': 'models', 'Payment': 'models',
+    'MuscleActivationPattern': 'models', 'Achievement': 'models',
+    'UserAchievement': 'models',
+    
     # Enums
-    UserRole, FitnessLevel, ExerciseType, SessionStatus,
-    SubscriptionStatus, PaymentStatus, AchievementType
-)
+    'UserRole': 'models', 'FitnessLevel': 'models', 'ExerciseType': 'models',
+    'SessionStatus': 'models', 'SubscriptionStatus': 'models',
+    'PaymentStatus': 'models', 'AchievementType': 'models',
+    
+    # Database management
+    'DatabaseConfig': 'database', 'get_database_config': 'database',
+    'DatabaseManager': 'database',
+    'AsyncDatabaseManager': 'database',
+    'DatabaseService': 'database', 'DatabaseHealthMonitor': 'database',
+    'db_service': 'database', 'get_db_service': 'database', 'get_db_session': 'database',
+    'get_async_db_session': 'database', 'get_db_health': 'database',
+    'get_db_liveness': 'database', 'get_db_readiness': 'database',
+    
+    # Migration management
+    'MigrationManager': 'migrations', 'migration_manager': 'migrations',
+    'get_migration_manager': 'migrations',
+    'init_migrations': 'migrations', 'create_migration': 'migrations',
+    'run_migrations': 'migrations', 'rollback_migration': 'migrations',
+    'get_schema_status': 'migrations',
+}
 
-from .database import (
-    DatabaseConfig, DatabaseManager, DatabaseService,
-    DatabaseHealthMonitor, db_service, get_db_session, get_db_health
-)
 
-from .migrations import (
-    MigrationManager, migration_manager, init_migrations,
-    create_migration, run_migrations, rollback_migration, get_schema_status
-)
+def __getattr__(name: str):
+    """Resolve lazily exported names on first access"""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
 
-# Version information
-__version__ = "1.0.0"
 
 # Quick setup function
 def setup_database(database_url: str = None, auto_migrate: bool = True) -> bool:
@@ -33,11 +65,11 @@ def setup_database(database_url: str = None, auto_migrate: bool = True) -> bool:
     Args:
         database_url: Database connection URL
         auto_migrate: Whether to run migrations automatically
-        
+    
     Returns:
         True if setup successful, False otherwise
     """
-    import os
+    from .database import get_db_service
     
     # Set database URL if provided
     if database_url:
@@ -48,9 +80,11 @@ def setup_database(database_url: str = None, auto_migrate: bool = True) -> bool:
         os.environ["DB_AUTO_MIGRATE"] = "true"
     
     # Initialize database service
-    success = db_service.initialize()
+    success = get_db_service().initialize()
     
     if success and auto_migrate:
+        from .migrations import init_migrations, run_migrations
+        
         # Initialize migrations if needed
         init_migrations()
         
@@ -71,13 +105,20 @@ __all__ = [
     'SubscriptionStatus', 'PaymentStatus', 'AchievementType',
     
     # Database management
-    'DatabaseConfig', 'DatabaseManager', 'DatabaseService',
-    'DatabaseHealthMonitor', 'db_service', 'get_db_session', 'get_db_health',
+    'DatabaseConfig', 'get_database_config', 'DatabaseManager', 'AsyncDatabaseManager',
+    'DatabaseService',
+    'DatabaseHealthMonitor', 'db_service', 'get_db_service', 'get_db_session', 'get_async_db_session',
+    'get_db_health', 'get_db_liveness', 'get_db_readiness',
     
     # Migration management
-    'MigrationManager', 'migration_manager', 'init_migrations',
+    'MigrationManager', 'migration_manager', 'get_migration_manager', 'init_migrations',
     'create_migration', 'run_migrations', 'rollback_migration', 'get_schema_status',
     
     # Utilities
     'setup_database'
-]
\ No newline at end of file
+]
+
+# Resolve every lazy export up front so CI catches broken deferred imports
+if os.getenv("CORESENSE_EAGER_IMPORT") == "1":
+    for _name in _LAZY_EXPORTS:
+        __getattr__(_name)
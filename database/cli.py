@@ -12,15 +12,16 @@ from pathlib import Path
 # Add the parent directory to the path so we can import our modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from database import (
-    setup_database, db_service, get_db_health,
-    init_migrations, create_migration, run_migrations, 
-    rollback_migration, get_schema_status
-)
-from database.sample_data import populate_sample_data, clear_all_data
+# Database imports are deferred to each command so that, for example,
+# `health` does not load Alembic or the sample data module
+
+MIGRATE_ACTIONS = ["init", "create", "up", "down", "status"]
 
 def setup_db_command(args):
     """Setup database and run migrations"""
+    from database import setup_database
+    from database.sample_data import populate_sample_data
+    
     print("Setting up CoreSense database...")
     
     # Set database URL if provided
@@ -49,6 +50,8 @@ def setup_db_command(args):
 
 def health_command(args):
     """Check database health"""
+    from database import get_db_health
+    
     print("Checking database health...")
     
     try:
@@ -74,23 +77,61 @@ def health_command(args):
 
 def migrate_command(args):
     """Migration management"""
+    if args.chain:
+        return migrate_chain(args)
+    
+    if not args.action:
+        print("❌ Migration action is required")
+        return 1
+    
+    return migrate_action(args.action, args)
+
+def migrate_chain(args):
+    """Run several migration actions on one shared database connection"""
+    from database import get_migration_manager
+    
+    actions = [action.strip() for action in args.chain.split(",") if action.strip()]
+    invalid = [action for action in actions if action not in MIGRATE_ACTIONS]
+    if invalid:
+        print(f"❌ Unknown migration action(s): {', '.join(invalid)}")
+        return 1
+    
     try:
-        if args.action == "init":
+        with get_migration_manager().connect() as conn:
+            for action in actions:
+                result = migrate_action(action, args, conn)
+                if result:
+                    return result
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Migration command failed: {e}")
+        return 1
+
+def migrate_action(action, args, conn=None):
+    """Run a single migration action, optionally on an existing connection"""
+    from database import (
+        init_migrations, create_migration, run_migrations,
+        rollback_migration, get_schema_status
+    )
+    
+    try:
+        if action == "init":
             print("Initializing migration repository...")
-            if init_migrations():
+            if init_migrations(conn=conn):
                 print("✅ Migration repository initialized")
                 return 0
             else:
                 print("❌ Failed to initialize migrations")
                 return 1
                 
-        elif args.action == "create":
+        elif action == "create":
             if not args.message:
                 print("❌ Migration message is required")
                 return 1
             
             print(f"Creating migration: {args.message}")
-            revision = create_migration(args.message)
+            revision = create_migration(args.message, conn=conn)
             if revision:
                 print(f"✅ Migration created: {revision}")
                 return 0
@@ -98,28 +139,28 @@ def migrate_command(args):
                 print("❌ Failed to create migration")
                 return 1
                 
-        elif args.action == "up":
+        elif action == "up":
             print("Running migrations...")
-            if run_migrations():
+            if run_migrations(conn=conn):
                 print("✅ Migrations completed")
                 return 0
             else:
                 print("❌ Migration failed")
                 return 1
                 
-        elif args.action == "down":
+        elif action == "down":
             revision = args.revision or "-1"
             print(f"Rolling back to revision: {revision}")
-            if rollback_migration(revision):
+            if rollback_migration(revision, conn=conn):
                 print("✅ Rollback completed")
                 return 0
             else:
                 print("❌ Rollback failed")
                 return 1
                 
-        elif args.action == "status":
+        elif action == "status":
             print("Getting migration status...")
-            status = get_schema_status()
+            status = get_schema_status(conn=conn)
             
             print(f"Current Revision: {status.get('current_revision', 'None')}")
             print(f"Total Tables: {len(status.get('tables', []))}")
@@ -141,6 +182,8 @@ def migrate_command(args):
 
 def data_command(args):
     """Data management"""
+    from database.sample_data import populate_sample_data, clear_all_data
+    
     try:
         if args.action == "populate":
             print(f"Populating database with sample data...")
@@ -195,8 +238,10 @@ def main():
     
     # Migration commands
     migrate_parser = subparsers.add_parser("migrate", help="Migration management")
-    migrate_parser.add_argument("action", choices=["init", "create", "up", "down", "status"],
+    migrate_parser.add_argument("action", nargs="?", choices=MIGRATE_ACTIONS,
                                help="Migration action")
+    migrate_parser.add_argument("--chain",
+                               help="Comma-separated actions sharing one connection (e.g. up,status)")
     migrate_parser.add_argument("--message", help="Migration message (for create)")
     migrate_parser.add_argument("--revision", help="Target revision (for down)")
     migrate_parser.set_defaults(func=migrate_command)
@@ -5,13 +5,19 @@ health monitoring, and production-ready features.
 """
 
 import os
+import copy
+import functools
+import importlib.util
 import logging
-from typing import Generator, Optional, Dict, Any
-from contextlib import contextmanager
+import threading
+import weakref
+from types import MappingProxyType
+from typing import AsyncGenerator, Generator, Optional, Dict, Any, Mapping, TYPE_CHECKING
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
 
 from sqlalchemy import (
-    create_engine, MetaData, text, event, pool, exc
+    create_engine, MetaData, text, event, pool, exc, insert, update, bindparam, inspect
 )
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool, StaticPool, NullPool
@@ -19,12 +25,86 @@ from sqlalchemy.engine import Engine
 import time
 
 # Import our models
-from .models import Base
+from .models import (
+    Base, User, UserSession, MuscleActivationPattern, USER_PROFILE_LOAD, PARTITION_SENSOR_DATA
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+# Optional primary-key cache for hot lookups
+try:
+    from dogpile.cache import make_region
+    DOGPILE_AVAILABLE = True
+except ImportError:
+    DOGPILE_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Memory-mapped I/O window for file-backed SQLite databases (256 MB)
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+# Async DBAPI driver used for each database backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+}
+
+
+# SQLite-specific settings
+SQLITE_CONNECT_ARGS = MappingProxyType({
+    "check_same_thread": False,
+    "timeout": 20,
+    "isolation_level": None
+})
+
+# PostgreSQL-specific settings (libpq options: disable JIT for better
+# connection time, 60s statement timeout)
+POSTGRES_CONNECT_ARGS = MappingProxyType({
+    "connect_timeout": 10,
+    "options": "-c jit=off -c statement_timeout=60000"
+})
+
+# psycopg 3 additionally prepares statements server-side after 5 executions
+PSYCOPG_CONNECT_ARGS = MappingProxyType({
+    **POSTGRES_CONNECT_ARGS,
+    "prepare_threshold": 5
+})
+
+# Prefer the psycopg 3 driver for plain postgresql:// URLs when it is installed
+PSYCOPG_AVAILABLE = importlib.util.find_spec("psycopg") is not None
+
+# MySQL-specific settings
+MYSQL_CONNECT_ARGS = MappingProxyType({
+    "connect_timeout": 10,
+    "read_timeout": 60,
+    "write_timeout": 60,
+    "charset": "utf8mb4"
+})
+
+CONNECT_ARGS_BY_DIALECT = MappingProxyType({
+    "sqlite": SQLITE_CONNECT_ARGS,
+    "postgresql": POSTGRES_CONNECT_ARGS,
+    "mysql": MYSQL_CONNECT_ARGS,
+})
+
+_NO_CONNECT_ARGS = MappingProxyType({})
+
+
+def _detect_dialect(url: str) -> str:
+    """Get the backend name from a database URL, ignoring any +driver suffix"""
+    return url.partition("://")[0].split("+", 1)[0]
+
+
+def _to_async_url(url: str) -> str:
+    """Rewrite a database URL to use the backend's async driver"""
+    _, sep, rest = url.partition("://")
+    driver = ASYNC_DRIVERS.get(_detect_dialect(url))
+    return f"{driver}{sep}{rest}" if driver and sep else url
+
 class DatabaseConfig:
     """Comprehensive database configuration with environment-based settings"""
     
@@ -33,40 +113,31 @@ class DatabaseConfig:
         self.DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./coresense.db")
         
         # Connection Pool Settings
-        self.POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
-        self.MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
-        self.POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+        # Default pool size scales with the number of web workers/threads
+        default_pool_size = max(5, int(os.getenv("WEB_CONCURRENCY", "1")) * 2)
+        self.POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", str(default_pool_size)))
+        self.MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", str(self.POOL_SIZE)))
+        self.POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "5"))  # Fail fast when exhausted
+        self.POOL_USE_LIFO: bool = os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true"
+        self.POOL_WARN_RATIO: float = float(os.getenv("DB_POOL_WARN_RATIO", "0.8"))
         self.POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # 1 hour
         self.POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
         
-        # SQLite-specific settings
-        self.SQLITE_CONNECT_ARGS = {
-            "check_same_thread": False,
-            "timeout": 20,
-            "isolation_level": None
-        }
+        # Database backend ("sqlite", "postgresql", "mysql", ...)
+        self.DIALECT: str = _detect_dialect(self.DATABASE_URL)
         
-        # PostgreSQL-specific settings
-        self.POSTGRES_CONNECT_ARGS = {
-            "connect_timeout": 10,
-            "command_timeout": 60,
-            "server_settings": {
-                "jit": "off"  # Disable JIT for better connection time
-            }
-        }
-        
-        # MySQL-specific settings
-        self.MYSQL_CONNECT_ARGS = {
-            "connect_timeout": 10,
-            "read_timeout": 60,
-            "write_timeout": 60,
-            "charset": "utf8mb4"
-        }
+        # Backend-specific connection arguments (shared, read-only)
+        self.SQLITE_CONNECT_ARGS = SQLITE_CONNECT_ARGS
+        self.POSTGRES_CONNECT_ARGS = POSTGRES_CONNECT_ARGS
+        self.MYSQL_CONNECT_ARGS = MYSQL_CONNECT_ARGS
         
         # General settings
         self.ECHO_SQL: bool = os.getenv("DB_ECHO", "false").lower() == "true"
         self.AUTOCOMMIT: bool = False
         self.AUTOFLUSH: bool = False
+        # Keep loaded attributes after commit instead of re-SELECTing on access
+        self.EXPIRE_ON_COMMIT: bool = False
+        self.QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
         
         # Health check settings
         self.HEALTH_CHECK_ENABLED: bool = os.getenv("DB_HEALTH_CHECK", "true").lower() == "true"
@@ -76,14 +147,35 @@ class DatabaseConfig:
         self.SLOW_QUERY_THRESHOLD: float = float(os.getenv("DB_SLOW_QUERY_THRESHOLD", "1.0"))
         self.ENABLE_QUERY_STATS: bool = os.getenv("DB_QUERY_STATS", "false").lower() == "true"
         
+        # Primary-key lookup cache (requires dogpile.cache; Redis when REDIS_URL is set)
+        self.CACHE_ENABLED: bool = os.getenv("DB_CACHE_ENABLED", "true").lower() == "true"
+        self.CACHE_EXPIRATION: int = int(os.getenv("DB_CACHE_EXPIRATION", "300"))
+        self.CACHE_REDIS_URL: Optional[str] = os.getenv("REDIS_URL") or None
+        
         # Migration settings
         self.AUTO_MIGRATE: bool = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"
         self.BACKUP_BEFORE_MIGRATE: bool = os.getenv("DB_BACKUP_BEFORE_MIGRATE", "true").lower() == "true"
+        # Pages copied per SQLite backup step; 0 snapshots with VACUUM INTO instead
+        self.BACKUP_PAGES: int = int(os.getenv("DB_BACKUP_PAGES", "1024"))
+        # Store SQLite backups as .db.zst (requires zstandard)
+        self.BACKUP_COMPRESS: bool = os.getenv("DB_BACKUP_COMPRESS", "true").lower() == "true"
+
+@functools.cache
+def get_database_config() -> DatabaseConfig:
+    """
+    Get the process-wide database configuration
+    
+    Environment variables are read once; call get_database_config.cache_clear()
+    after changing them to pick up the new values.
+    """
+    return DatabaseConfig()
 
 class DatabaseHealthMonitor:
     """Database health monitoring and metrics collection"""
     
-    def __init__(self):
+    def __init__(self, slow_query_threshold: float = 1.0):
+        self.slow_query_threshold = slow_query_threshold
+        self._slow_query_ns = int(slow_query_threshold * 1e9)
         self.connection_count = 0
         self.query_count = 0
         self.slow_query_count = 0
@@ -95,10 +187,16 @@ class DatabaseHealthMonitor:
         self.connection_count += 1
         
     def record_query(self, duration: float):
+        self.record_query_ns(int(duration * 1e9))
+        
+    def record_query_ns(self, duration_ns: int) -> bool:
+        """Record a query duration in nanoseconds; returns True if it was slow"""
         self.query_count += 1
-        if duration > DatabaseConfig().SLOW_QUERY_THRESHOLD:
+        if duration_ns > self._slow_query_ns:
             self.slow_query_count += 1
-            logger.warning(f"Slow query detected: {duration:.2f}s")
+            logger.warning(f"Slow query detected: {duration_ns / 1e9:.2f}s")
+            return True
+        return False
             
     def record_error(self):
         self.error_count += 1
@@ -117,32 +215,41 @@ class DatabaseManager:
     """Advanced database manager with connection pooling and monitoring"""
     
     def __init__(self, config: DatabaseConfig = None):
-        self.config = config or DatabaseConfig()
+        self.config = config or get_database_config()
         self.engine: Optional[Engine] = None
         self.session_factory = None
         self._initialized = False
-        self.health_monitor = DatabaseHealthMonitor()
+        self.health_monitor = DatabaseHealthMonitor(self.config.SLOW_QUERY_THRESHOLD)
         self._last_health_check = None
         
+    def _is_sqlite_memory(self) -> bool:
+        """Check whether the database is an in-memory SQLite database"""
+        url = self.config.DATABASE_URL
+        return self.config.DIALECT == "sqlite" and (
+            ":memory:" in url or "mode=memory" in url or url.rstrip("/").endswith("sqlite:")
+        )
+    
     def _get_pool_class(self) -> type:
         """Determine appropriate pool class based on database type"""
-        if self.config.DATABASE_URL.startswith("sqlite"):
-            return StaticPool
-        elif "sqlite" in self.config.DATABASE_URL:
+        # An in-memory SQLite database only exists on its single connection;
+        # file-backed SQLite gets a real pool so threads don't share one connection
+        if self._is_sqlite_memory():
             return StaticPool
         else:
             return QueuePool
             
-    def _get_connect_args(self) -> Dict[str, Any]:
+    def _get_engine_url(self) -> str:
+        """Get the engine URL, selecting psycopg 3 when no PostgreSQL driver is given"""
+        url = self.config.DATABASE_URL
+        if PSYCOPG_AVAILABLE and url.startswith("postgresql://"):
+            return "postgresql+psycopg://" + url[len("postgresql://"):]
+        return url
+    
+    def _get_connect_args(self) -> Mapping[str, Any]:
         """Get database-specific connection arguments"""
-        if self.config.DATABASE_URL.startswith("sqlite"):
-            return self.config.SQLITE_CONNECT_ARGS
-        elif self.config.DATABASE_URL.startswith("postgresql"):
-            return self.config.POSTGRES_CONNECT_ARGS
-        elif self.config.DATABASE_URL.startswith("mysql"):
-            return self.config.MYSQL_CONNECT_ARGS
-        else:
-            return {}
+        if self._get_engine_url().startswith("postgresql+psycopg://"):
+            return PSYCOPG_CONNECT_ARGS
+        return CONNECT_ARGS_BY_DIALECT.get(self.config.DIALECT, _NO_CONNECT_ARGS)
     
     def _setup_engine_events(self):
         """Setup SQLAlchemy engine event listeners for monitoring"""
@@ -154,17 +261,30 @@ class DatabaseManager:
             self.health_monitor.record_connection()
             logger.debug("Database connection established")
             
-        @event.listens_for(self.engine, "before_cursor_execute")
-        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            context._query_start_time = time.time()
-            
-        @event.listens_for(self.engine, "after_cursor_execute")
-        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-            total = time.time() - context._query_start_time
-            self.health_monitor.record_query(total)
+        if self.config.DIALECT == "sqlite" and not self._is_sqlite_memory():
+            @event.listens_for(self.engine, "connect")
+            def set_sqlite_pragmas(dbapi_connection, connection_record):
+                # WAL lets readers run alongside a writer; mmap avoids read syscalls
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+                cursor.close()
             
-            if self.config.ENABLE_QUERY_STATS and total > self.config.SLOW_QUERY_THRESHOLD:
-                logger.warning(f"Slow query: {total:.2f}s - {statement[:100]}...")
+        # Per-statement timing only runs when query stats are enabled
+        if self.config.ENABLE_QUERY_STATS:
+            # Integer nanoseconds keep the per-statement path free of float math
+            @event.listens_for(self.engine, "before_cursor_execute")
+            def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+                context._query_start_ns = time.perf_counter_ns()
+                
+            @event.listens_for(self.engine, "after_cursor_execute")
+            def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+                elapsed_ns = time.perf_counter_ns() - context._query_start_ns
+                
+                if self.health_monitor.record_query_ns(elapsed_ns):
+                    logger.warning(f"Slow query: {elapsed_ns / 1e9:.2f}s - {statement[:100]}...")
                 
         @event.listens_for(self.engine, "handle_error")
         def handle_error(exception_context):
@@ -181,26 +301,30 @@ class DatabaseManager:
         try:
             pool_class = self._get_pool_class()
             connect_args = self._get_connect_args()
+            url = self._get_engine_url()
             
             # Create engine with appropriate settings
             if pool_class == StaticPool:
-                # SQLite configuration
+                # In-memory SQLite configuration
                 self.engine = create_engine(
-                    self.config.DATABASE_URL,
+                    url,
                     connect_args=connect_args,
                     poolclass=pool_class,
+                    query_cache_size=self.config.QUERY_CACHE_SIZE,
                     echo=self.config.ECHO_SQL
                 )
             else:
-                # PostgreSQL/MySQL configuration with connection pooling
+                # File-backed SQLite/PostgreSQL/MySQL configuration with connection pooling
                 self.engine = create_engine(
-                    self.config.DATABASE_URL,
+                    url,
                     pool_size=self.config.POOL_SIZE,
                     max_overflow=self.config.MAX_OVERFLOW,
                     pool_timeout=self.config.POOL_TIMEOUT,
                     pool_recycle=self.config.POOL_RECYCLE,
                     pool_pre_ping=self.config.POOL_PRE_PING,
+                    pool_use_lifo=self.config.POOL_USE_LIFO,
                     connect_args=connect_args,
+                    query_cache_size=self.config.QUERY_CACHE_SIZE,
                     echo=self.config.ECHO_SQL,
                     poolclass=pool_class
                 )
@@ -212,18 +336,26 @@ class DatabaseManager:
             self.session_factory = sessionmaker(
                 autocommit=self.config.AUTOCOMMIT,
                 autoflush=self.config.AUTOFLUSH,
+                expire_on_commit=self.config.EXPIRE_ON_COMMIT,
                 bind=self.engine
             )
             
-            # Test connection and create tables
-            self.test_connection()
+            if self.config.POOL_PRE_PING and pool_class != StaticPool:
+                # Every checkout is pinged anyway, so probe in the background
+                # instead of delaying startup by up to ~7s of retries. In-memory
+                # SQLite shares one connection and is checked synchronously.
+                self.health_monitor.health_status = "initializing"
+                threading.Thread(
+                    target=self.test_connection, name="db-connection-test", daemon=True
+                ).start()
+            else:
+                self.test_connection()
             
             if self.config.AUTO_MIGRATE:
                 self.create_tables()
             
             self._initialized = True
-            self.health_monitor.health_status = "healthy"
-            logger.info(f"Database initialized successfully: {self._mask_url(self.config.DATABASE_URL)}")
+            logger.info(f"Database initialized successfully: {self._mask_url(url)}")
             
             return True
             
@@ -232,7 +364,8 @@ class DatabaseManager:
             logger.error(f"Failed to initialize database: {e}")
             return False
     
-    def _mask_url(self, url: str) -> str:
+    @staticmethod
+    def _mask_url(url: str) -> str:
         """Mask sensitive information in database URL for logging"""
         if "://" in url:
             scheme, rest = url.split("://", 1)
@@ -245,11 +378,74 @@ class DatabaseManager:
         """Create all database tables"""
         try:
             Base.metadata.create_all(bind=self.engine)
+            if PARTITION_SENSOR_DATA and self.config.DIALECT == "postgresql":
+                self.ensure_sensor_partitions()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Failed to create tables: {e}")
             raise
     
+    def ensure_sensor_partitions(self, months_ahead: int = 3) -> None:
+        """
+        Create monthly muscle activation partitions from this month onwards
+        
+        Rows can only be inserted into an existing partition, so run this
+        regularly (e.g. daily) on partitioned PostgreSQL deployments.
+        
+        Args:
+            months_ahead: Number of future months to create besides the current one
+        """
+        table = MuscleActivationPattern.__tablename__
+        now = datetime.now(timezone.utc)
+        year, month = now.year, now.month
+        
+        with self.engine.begin() as connection:
+            for _ in range(months_ahead + 1):
+                next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {table}_y{year}m{month:02d} "
+                    f"PARTITION OF {table} FOR VALUES "
+                    f"FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')"
+                ))
+                year, month = next_year, next_month
+    
+    def drop_sensor_partitions_before(self, cutoff: datetime) -> int:
+        """
+        Detach and drop muscle activation partitions entirely older than cutoff
+        
+        Dropping a partition is O(1), unlike deleting its rows.
+        
+        Args:
+            cutoff: Partitions for months before cutoff's month are removed
+            
+        Returns:
+            Number of partitions dropped
+        """
+        table = MuscleActivationPattern.__tablename__
+        oldest_kept = f"{table}_y{cutoff.year}m{cutoff.month:02d}"
+        dropped = 0
+        
+        with self.engine.begin() as connection:
+            partitions = connection.execute(text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ), {"table": table}).scalars().all()
+            
+            # Monthly partition names sort chronologically (zero-padded year and month)
+            monthly = sorted(name for name in partitions if name.startswith(f"{table}_y"))
+            for partition in monthly:
+                if partition >= oldest_kept:
+                    break
+                connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition}"))
+                connection.execute(text(f"DROP TABLE {partition}"))
+                dropped += 1
+        
+        if dropped:
+            logger.info(f"Dropped {dropped} muscle activation partitions before {oldest_kept}")
+        return dropped
+    
     def drop_tables(self):
         """Drop all database tables (use with caution!)"""
         try:
@@ -259,14 +455,16 @@ class DatabaseManager:
             logger.error(f"Failed to drop tables: {e}")
             raise
     
-    def test_connection(self) -> bool:
+    def test_connection(self, max_retries: int = 3) -> bool:
         """
         Test database connection with retry logic
         
+        Args:
+            max_retries: Number of attempts before giving up
+        
         Returns:
             True if connection successful, False otherwise
         """
-        max_retries = 3
         retry_delay = 1
         
         for attempt in range(max_retries):
@@ -291,27 +489,65 @@ class DatabaseManager:
                     
         return False
     
-    def health_check(self) -> Dict[str, Any]:
+    def liveness(self) -> Dict[str, Any]:
         """
-        Perform comprehensive health check
+        Cheap health snapshot from in-process counters, without any database I/O
         
         Returns:
-            Dictionary containing health status and metrics
+            Dictionary containing cached health status and pool metrics
         """
         health_data = self.health_monitor.get_health_stats()
+        health_data["connection_healthy"] = self.health_monitor.health_status == "healthy"
+        self._add_pool_stats(health_data)
+        return health_data
+    
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Health check that also probes the database connection
+        
+        Returns:
+            Dictionary containing health status and metrics
+        """
+        # Test the connection at most once per interval, without retry backoff;
+        # in between, report the cached status
+        now = time.monotonic()
+        if (self._last_health_check is None
+                or now - self._last_health_check >= self.config.HEALTH_CHECK_INTERVAL):
+            self._last_health_check = now
+            connection_healthy = self.test_connection(max_retries=1)
+        else:
+            connection_healthy = self.health_monitor.health_status == "healthy"
         
-        # Test current connection
-        connection_healthy = self.test_connection()
+        health_data = self.health_monitor.get_health_stats()
         health_data["connection_healthy"] = connection_healthy
+        self._add_pool_stats(health_data)
+        return health_data
+    
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Perform comprehensive health check
         
-        # Check pool status if available
-        if hasattr(self.engine.pool, 'size'):
-            health_data["pool_size"] = self.engine.pool.size()
-            health_data["checked_in"] = self.engine.pool.checkedin()
-            health_data["checked_out"] = self.engine.pool.checkedout()
-            health_data["invalid"] = self.engine.pool.invalidated()
+        Returns:
+            Dictionary containing health status and metrics
+        """
+        return self.readiness()
+    
+    def _add_pool_stats(self, health_data: Dict[str, Any]):
+        """Add connection pool counters to health data, if the pool has them"""
+        if self.engine is None or not hasattr(self.engine.pool, 'size'):
+            return
         
-        return health_data
+        health_data["pool_size"] = self.engine.pool.size()
+        health_data["checked_in"] = self.engine.pool.checkedin()
+        health_data["checked_out"] = self.engine.pool.checkedout()
+        health_data["invalid"] = self.engine.pool.invalidated()
+        
+        pool_size = health_data["pool_size"]
+        if pool_size and health_data["checked_out"] / pool_size >= self.config.POOL_WARN_RATIO:
+            logger.warning(
+                f"Connection pool nearly exhausted: {health_data['checked_out']} of "
+                f"{pool_size} connections checked out (overflow {self.config.MAX_OVERFLOW})"
+            )
     
     def get_session(self) -> Session:
         """
@@ -358,11 +594,144 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error closing database connections: {e}")
 
+class AsyncDatabaseManager:
+    """Async database manager so asyncio frameworks don't block the event loop"""
+    
+    def __init__(self, config: DatabaseConfig = None):
+        self.config = config or get_database_config()
+        self.engine: Optional["AsyncEngine"] = None
+        self.session_factory = None
+        self._initialized = False
+    
+    def initialize(self) -> bool:
+        """
+        Create the async engine and session factory
+        
+        Requires the backend's async driver (asyncpg, aiosqlite or aiomysql).
+        
+        Returns:
+            True if initialization successful, False otherwise
+        """
+        try:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+            
+            url = _to_async_url(self.config.DATABASE_URL)
+            if url.startswith("sqlite"):
+                self.engine = create_async_engine(
+                    url,
+                    query_cache_size=self.config.QUERY_CACHE_SIZE,
+                    echo=self.config.ECHO_SQL
+                )
+            else:
+                self.engine = create_async_engine(
+                    url,
+                    pool_size=self.config.POOL_SIZE,
+                    max_overflow=self.config.MAX_OVERFLOW,
+                    pool_timeout=self.config.POOL_TIMEOUT,
+                    pool_recycle=self.config.POOL_RECYCLE,
+                    pool_pre_ping=self.config.POOL_PRE_PING,
+                    pool_use_lifo=self.config.POOL_USE_LIFO,
+                    query_cache_size=self.config.QUERY_CACHE_SIZE,
+                    echo=self.config.ECHO_SQL
+                )
+            
+            # Async sessions can't lazy-load expired attributes, so keep them after commit
+            self.session_factory = async_sessionmaker(
+                self.engine,
+                autoflush=self.config.AUTOFLUSH,
+                expire_on_commit=False
+            )
+            
+            self._initialized = True
+            logger.info(f"Async database initialized: {DatabaseManager._mask_url(url)}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize async database: {e}")
+            return False
+    
+    @asynccontextmanager
+    async def get_session_context(self) -> AsyncGenerator["AsyncSession", None]:
+        """
+        Get an async database session with automatic commit/rollback
+        
+        Yields:
+            SQLAlchemy AsyncSession object
+        """
+        if not self._initialized:
+            raise RuntimeError("Async database not initialized. Call initialize() first.")
+        
+        async with self.session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.error(f"Async database session error: {e}")
+                raise
+    
+    async def close(self):
+        """Dispose of the async engine and its connections"""
+        if self.engine:
+            await self.engine.dispose()
+            logger.info("Async database connections closed")
+
+# Deactivates sessions that expired before :now; built once, only bound per call
+_EXPIRE_SESSIONS_STMT = (
+    update(UserSession)
+    .where(UserSession.expires_at < bindparam("now"), UserSession.is_active.is_(True))
+    .values(is_active=False)
+    .execution_options(synchronize_session=False)
+)
+
+# Models whose primary-key lookups go through the cache region
+CACHED_MODELS = (User,)
+
+
+def _make_cache_region(config: DatabaseConfig):
+    """Create the primary-key cache region, or None if caching is unavailable"""
+    if not (DOGPILE_AVAILABLE and config.CACHE_ENABLED):
+        return None
+    
+    if config.CACHE_REDIS_URL:
+        return make_region().configure(
+            "dogpile.cache.redis",
+            expiration_time=config.CACHE_EXPIRATION,
+            arguments={"url": config.CACHE_REDIS_URL}
+        )
+    return make_region().configure(
+        "dogpile.cache.memory",
+        expiration_time=config.CACHE_EXPIRATION
+    )
+
+def _row_dict(obj) -> Dict[str, Any]:
+    """Column values of a loaded instance, as a plain dict"""
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+# Services with a cache region; weak so a discarded service is not kept alive
+_caching_services: "weakref.WeakSet[DatabaseService]" = weakref.WeakSet()
+
+def _invalidate_cached_row(mapper, connection, target):
+    """Drop a cached row from every live service when the ORM updates or deletes it"""
+    for service in tuple(_caching_services):
+        service._invalidate_instance(mapper, connection, target)
+
+# Registered once per model rather than per service instance
+for _model in CACHED_MODELS:
+    event.listen(_model, "after_update", _invalidate_cached_row)
+    event.listen(_model, "after_delete", _invalidate_cached_row)
+
 class DatabaseService:
     """High-level database service with comprehensive CRUD operations"""
     
-    def __init__(self, db_manager: DatabaseManager = None):
+    def __init__(self, db_manager: DatabaseManager = None,
+                 async_db_manager: AsyncDatabaseManager = None):
         self.db_manager = db_manager or DatabaseManager()
+        self.async_db_manager = async_db_manager or AsyncDatabaseManager(self.db_manager.config)
+        self.cache_region = _make_cache_region(self.db_manager.config)
+        
+        if self.cache_region is not None:
+            _caching_services.add(self)
         
     def initialize(self) -> bool:
         """Initialize database service"""
@@ -372,6 +741,14 @@ class DatabaseService:
         """Get database health status"""
         return self.db_manager.health_check()
     
+    def liveness(self) -> Dict[str, Any]:
+        """Get cached health status and pool metrics without touching the database"""
+        return self.db_manager.liveness()
+    
+    def readiness(self) -> Dict[str, Any]:
+        """Get health status including a (rate-limited) connection probe"""
+        return self.db_manager.readiness()
+    
     def get_session(self) -> Session:
         """Get a new database session"""
         return self.db_manager.get_session()
@@ -389,6 +766,82 @@ class DatabaseService:
         with self.db_manager.get_session_context() as session:
             yield session
     
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncGenerator["AsyncSession", None]:
+        """
+        Async transactional scope; the async engine is created on first use
+        
+        Usage:
+            async with db_service.async_session_scope() as session:
+                result = await session.execute(select(User).filter_by(email=email))
+        """
+        if not self.async_db_manager._initialized and not self.async_db_manager.initialize():
+            raise RuntimeError("Async database could not be initialized")
+        
+        async with self.async_db_manager.get_session_context() as session:
+            yield session
+    
+    @staticmethod
+    def _cache_key(model_class, pk: Any) -> str:
+        return f"{model_class.__tablename__}:{pk}"
+    
+    def get_by_id_cached(self, model_class, pk: Any) -> Optional[Any]:
+        """
+        Get a row by primary key through the cache region
+        
+        Rows are cached as plain dicts of column values and every caller gets
+        its own copy, so no ORM instance is shared between callers or threads.
+        Misses are not cached.
+        
+        Args:
+            model_class: SQLAlchemy model class
+            pk: Primary key value
+            
+        Returns:
+            Dict of column values or None if not found
+        """
+        def load():
+            with self.session_scope() as session:
+                obj = session.get(model_class, pk)
+                return _row_dict(obj) if obj is not None else None
+        
+        if self.cache_region is None:
+            return load()
+        
+        row = self.cache_region.get_or_create(
+            self._cache_key(model_class, pk),
+            load,
+            should_cache_fn=lambda row: row is not None
+        )
+        # The memory backend returns the stored dict itself
+        return copy.deepcopy(row) if row is not None else None
+    
+    def invalidate(self, model_class, pk: Any):
+        """Remove a cached row so the next lookup reads it from the database"""
+        if self.cache_region is not None:
+            self.cache_region.delete(self._cache_key(model_class, pk))
+    
+    def _invalidate_instance(self, mapper, connection, target):
+        identity = mapper.primary_key_from_instance(target)
+        pk = identity[0] if len(identity) == 1 else tuple(identity)
+        self.invalidate(mapper.class_, pk)
+    
+    def get_user_profile(self, user_id: int) -> Optional[User]:
+        """
+        Get a user with subscriptions, payments and achievements loaded
+        
+        Relationships raise instead of lazy-loading, so everything the profile
+        view touches is loaded here in a fixed number of queries.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Detached User instance or None if not found
+        """
+        with self.session_scope() as session:
+            return session.get(User, user_id, options=USER_PROFILE_LOAD)
+    
     def create_user(self, user_data: Dict[str, Any]) -> Optional[int]:
         """
         Create a new user with comprehensive error handling
@@ -400,8 +853,6 @@ class DatabaseService:
             User ID if successful, None if failed
         """
         try:
-            from .models import User
-            
             with self.session_scope() as session:
                 user = User(**user_data)
                 session.add(user)
@@ -423,16 +874,42 @@ class DatabaseService:
         Returns:
             True if successful, False otherwise
         """
+        if not data_list:
+            return True
+        
         try:
             with self.session_scope() as session:
-                objects = [model_class(**data) for data in data_list]
-                session.bulk_save_objects(objects)
+                # executemany batches rows (insertmanyvalues) without building ORM objects
+                session.execute(insert(model_class), data_list)
                 return True
                 
         except Exception as e:
             logger.error(f"Failed to perform batch insert: {e}")
             return False
     
+    async def pipeline(self, statements: list) -> list:
+        """
+        Run several independent statements in one async transaction
+        
+        Group statements that don't depend on each other's results. A list
+        of parameter dicts runs as a single executemany, which the async
+        drivers batch into multi-row round trips.
+        
+        Args:
+            statements: List of (statement, params) tuples; params may be a
+                dict, a list of dicts or None. Strings are wrapped in text().
+            
+        Returns:
+            Result of each statement, in order
+        """
+        results = []
+        async with self.async_session_scope() as session:
+            for statement, params in statements:
+                if isinstance(statement, str):
+                    statement = text(statement)
+                results.append(await session.execute(statement, params))
+        return results
+    
     def execute_raw_query(self, query: str, params: Dict = None) -> Any:
         """
         Execute raw SQL query with parameters
@@ -453,6 +930,37 @@ class DatabaseService:
             logger.error(f"Failed to execute raw query: {e}")
             raise
     
+    def execute_raw_query_stream(self, query: str, params: Dict = None,
+                                 chunk_size: int = 1000) -> Generator[Any, None, None]:
+        """
+        Execute raw SQL query and yield rows without loading the full result
+        
+        Uses a server-side cursor where the driver supports one (PostgreSQL);
+        SQLite already fetches rows incrementally. The session stays open until
+        the generator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunk_size: Number of rows buffered per fetch
+            
+        Yields:
+            Result rows
+        """
+        try:
+            with self.session_scope() as session:
+                result = session.execute(
+                    text(query),
+                    params or {},
+                    execution_options={"stream_results": True, "max_row_buffer": chunk_size}
+                )
+                for partition in result.partitions(chunk_size):
+                    yield from partition
+                    
+        except Exception as e:
+            logger.error(f"Failed to stream raw query: {e}")
+            raise
+    
     def cleanup_expired_data(self) -> Dict[str, int]:
         """
         Clean up expired data across all relevant tables
@@ -463,20 +971,10 @@ class DatabaseService:
         cleanup_stats = {}
         
         try:
-            from .models import UserSession, AICoachingSession
-            from datetime import datetime, timezone
-            
             with self.session_scope() as session:
-                # Clean up expired sessions
-                expired_sessions = session.query(UserSession).filter(
-                    UserSession.expires_at < datetime.now(timezone.utc),
-                    UserSession.is_active == True
-                ).all()
-                
-                for user_session in expired_sessions:
-                    user_session.is_active = False
-                
-                cleanup_stats['expired_sessions'] = len(expired_sessions)
+                # Deactivate expired sessions in a single UPDATE
+                result = session.execute(_EXPIRE_SESSIONS_STMT, {"now": datetime.now(timezone.utc)})
+                cleanup_stats['expired_sessions'] = result.rowcount
                 
                 logger.info(f"Cleanup completed: {cleanup_stats}")
                 return cleanup_stats
@@ -485,26 +983,54 @@ class DatabaseService:
             logger.error(f"Failed to cleanup expired data: {e}")
             return {}
 
-# Global database service instance
-db_service = DatabaseService()
+# Global database service instance, created on first use
+@functools.cache
+def get_db_service() -> DatabaseService:
+    """Get the global database service instance"""
+    return DatabaseService()
+
+def __getattr__(name: str):
+    """Keep `db_service` importable as a module attribute without creating it at import"""
+    if name == "db_service":
+        return get_db_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Dependency for getting database sessions in FastAPI/other frameworks
 def get_db_session() -> Generator[Session, None, None]:
     """Dependency function for getting database sessions"""
-    with db_service.session_scope() as session:
+    with get_db_service().session_scope() as session:
+        yield session
+
+async def get_async_db_session() -> AsyncGenerator["AsyncSession", None]:
+    """Async dependency function for getting database sessions"""
+    async with get_db_service().async_session_scope() as session:
         yield session
 
 def get_db_health() -> Dict[str, Any]:
     """Get database health status for monitoring endpoints"""
-    return db_service.health_check()
+    return get_db_service().health_check()
+
+def get_db_liveness() -> Dict[str, Any]:
+    """Liveness probe for monitoring endpoints (no database I/O)"""
+    return get_db_service().liveness()
+
+def get_db_readiness() -> Dict[str, Any]:
+    """Readiness probe for monitoring endpoints (probes the connection)"""
+    return get_db_service().readiness()
 
 # Export classes and functions
 __all__ = [
     'DatabaseConfig',
+    'get_database_config',
     'DatabaseManager', 
+    'AsyncDatabaseManager',
     'DatabaseService',
     'DatabaseHealthMonitor',
     'db_service',
+    'get_db_service',
     'get_db_session',
-    'get_db_health'
+    'get_async_db_session',
+    'get_db_health',
+    'get_db_liveness',
+    'get_db_readiness'
 ]
\ No newline at end of file
@@ -4,70 +4,62 @@ Alembic-based migration management with backup and rollback capabilities
 """
 
 import os
+import errno
+import functools
 import logging
 import shutil
+import sqlite3
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator
 
-from alembic import command
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from alembic import command, op
 from alembic.config import Config
 from alembic.script import ScriptDirectory
 from alembic.migration import MigrationContext
 from alembic.operations import Operations
-from sqlalchemy import inspect, text
+from sqlalchemy import create_engine, inspect, text, select, update, bindparam, tuple_, Table
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.pool import NullPool
+
+from .database import DatabaseManager
 
-from .database import DatabaseManager, DatabaseConfig
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-class MigrationManager:
-    """Database migration management with backup and safety features"""
-    
-    def __init__(self, db_manager: DatabaseManager = None):
-        self.db_manager = db_manager or DatabaseManager()
-        self.config = DatabaseConfig()
-        self.alembic_cfg = None
-        self.migrations_dir = Path(__file__).parent / "migrations"
-        self.backups_dir = Path(__file__).parent / "backups"
-        
-        # Ensure directories exist
-        self.migrations_dir.mkdir(exist_ok=True)
-        self.backups_dir.mkdir(exist_ok=True)
-        
-        self._setup_alembic()
-    
-    def _setup_alembic(self):
-        """Setup Alembic configuration"""
-        try:
-            # Create alembic.ini if it doesn't exist
-            alembic_ini_path = self.migrations_dir / "alembic.ini"
-            if not alembic_ini_path.exists():
-                self._create_alembic_ini()
-            
-            # Setup Alembic config
-            self.alembic_cfg = Config(str(alembic_ini_path))
-            self.alembic_cfg.set_main_option("script_location", str(self.migrations_dir))
-            self.alembic_cfg.set_main_option("sqlalchemy.url", self.config.DATABASE_URL)
-            
-            # Create versions directory if it doesn't exist
-            versions_dir = self.migrations_dir / "versions"
-            versions_dir.mkdir(exist_ok=True)
-            
-            # Create env.py if it doesn't exist
-            env_py_path = self.migrations_dir / "env.py"
-            if not env_py_path.exists():
-                self._create_env_py()
-                
-            logger.info("Alembic configuration setup completed")
-            
-        except Exception as e:
-            logger.error(f"Failed to setup Alembic: {e}")
-            raise
-    
-    def _create_alembic_ini(self):
-        """Create alembic.ini configuration file"""
-        alembic_ini_content = """
+# Marks an optional argument that wasn't passed, where None is a meaningful value
+_UNSET = object()
+
+# Buffer size for user-space file copies (shutil's default is 64 KiB on Linux)
+_COPY_BUFSIZE = int(os.getenv("DB_BACKUP_COPY_BUFSIZE", str(4 * 1024 * 1024)))
+
+# Linux ioctl that reflinks a whole file (copy-on-write clone on btrfs/XFS)
+_FICLONE = 0x40049409
+
+# errnos meaning "this copy mechanism isn't supported here", not a real I/O failure
+_UNSUPPORTED_COPY_ERRNOS = frozenset(
+    code for code in (
+        errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+        getattr(errno, "ENOTSUP", None)
+    ) if code is not None
+)
+
+# Generated alembic.ini and env.py, stripped and encoded once at import
+_ALEMBIC_INI = """
 # A generic, single database configuration.
 
 [alembic]
@@ -166,15 +158,9 @@ formatter = generic
 [formatter_generic]
 format = %(levelname)-5.5s [%(name)s] %(message)s
 datefmt = %H:%M:%S
-"""
-        
-        alembic_ini_path = self.migrations_dir / "alembic.ini"
-        with open(alembic_ini_path, 'w') as f:
-            f.write(alembic_ini_content.strip())
-    
-    def _create_env_py(self):
-        """Create env.py migration environment file"""
-        env_py_content = '''
+""".strip().encode()
+
+_ENV_PY = '''
 import logging
 from logging.config import fileConfig
 
@@ -239,6 +225,17 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Reuse a connection handed over through config.attributes, if any
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
@@ -258,69 +255,296 @@ if context.is_offline_mode():
     run_migrations_offline()
 else:
     run_migrations_online()
-'''
+'''.strip().encode()
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write a file through a temporary file and rename
+    
+    Concurrent readers (e.g. several workers starting at once) see either no
+    file or the complete file, never a partial write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst with the FICLONE ioctl; returns False where unsupported"""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError as e:
+        # ENOTTY/EBADF: the filesystem or file type has no reflink support
+        if e.errno in _UNSUPPORTED_COPY_ERRNOS or e.errno in (errno.ENOTTY, errno.EBADF):
+            return False
+        raise
+
+def _fast_file_copy(src, dst) -> None:
+    """
+    Copy a file inside the kernel where possible, preserving metadata like shutil.copy2
+    
+    Tries a FICLONE reflink (an O(1) copy-on-write clone on btrfs/XFS), then
+    os.copy_file_range (server-side copy capable), then os.sendfile, then a
+    buffered user-space copy for whatever remains. Hardlinks are never used:
+    SQLite writes pages in place, so a linked "backup" would change with the source.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
         
-        env_py_path = self.migrations_dir / "env.py"
-        with open(env_py_path, 'w') as f:
-            f.write(env_py_content.strip())
+        if not _reflink(src_fd, dst_fd):
+            remaining = os.fstat(src_fd).st_size
+            
+            # Both calls advance the file offsets, so each fallback resumes where the last stopped
+            kernel_copies = []
+            if hasattr(os, "copy_file_range"):
+                kernel_copies.append(lambda count: os.copy_file_range(src_fd, dst_fd, count))
+            if hasattr(os, "sendfile"):
+                kernel_copies.append(lambda count: os.sendfile(dst_fd, src_fd, None, count))
+            
+            for kernel_copy in kernel_copies:
+                try:
+                    while remaining > 0:
+                        copied = kernel_copy(remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    break
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED_COPY_ERRNOS:
+                        raise
+            
+            shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
     
-    def init_migrations(self) -> bool:
-        """Initialize migration repository"""
+    shutil.copystat(src, dst)
+
+def _compress_backup(path: Path) -> Path:
+    """Stream a backup file into path.zst with multithreaded zstd and remove the original"""
+    compressed_path = path.with_name(path.name + ".zst")
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(path, "rb") as fsrc, open(compressed_path, "wb") as fdst:
+        compressor.copy_stream(fsrc, fdst, read_size=_COPY_BUFSIZE, write_size=_COPY_BUFSIZE)
+    shutil.copystat(path, compressed_path)
+    path.unlink()
+    return compressed_path
+
+def _decompress_backup(src, dst) -> None:
+    """Stream a .zst backup back into a plain database file"""
+    decompressor = zstandard.ZstdDecompressor()
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        decompressor.copy_stream(fsrc, fdst, read_size=_COPY_BUFSIZE, write_size=_COPY_BUFSIZE)
+
+class MigrationManager:
+    """Database migration management with backup and safety features"""
+    
+    # Migration directories already prepared by this process
+    _setup_done: set = set()
+    
+    def __init__(self, db_manager: DatabaseManager = None):
+        self.db_manager = db_manager or DatabaseManager()
+        self.config = self.db_manager.config
+        # Parsed once; handles sqlite+driver://, absolute paths and query strings
+        self._url = make_url(self.config.DATABASE_URL)
+        self.alembic_cfg = None
+        self.migrations_dir = Path(__file__).parent / "migrations"
+        self.backups_dir = Path(__file__).parent / "backups"
+        
+        self._setup_alembic()
+    
+    def _ensure_migration_files(self):
+        """
+        Create the migration directories and generated files that are missing
+        
+        Everything inside migrations/ touches a distinct path, so those steps
+        run concurrently; on network volumes this hides most of the latency.
+        """
+        self.migrations_dir.mkdir(exist_ok=True)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(self.backups_dir.mkdir, exist_ok=True),
+                pool.submit((self.migrations_dir / "versions").mkdir, exist_ok=True),
+                # Existing files may be customized, so they are never overwritten
+                pool.submit(self._create_if_missing, "alembic.ini", self._create_alembic_ini),
+                pool.submit(self._create_if_missing, "env.py", self._create_env_py),
+            ]
+        
+        # Surface the first failure, if any
+        for future in futures:
+            future.result()
+    
+    def _create_if_missing(self, filename: str, create: Callable[[], None]) -> None:
+        """Run create() unless migrations/<filename> already exists"""
+        if not (self.migrations_dir / filename).exists():
+            create()
+    
+    def _setup_alembic(self):
+        """Setup Alembic configuration"""
+        try:
+            # The filesystem layout only needs checking once per process
+            setup_key = str(self.migrations_dir)
+            if setup_key not in MigrationManager._setup_done:
+                self._ensure_migration_files()
+                self._check_env_py_hook()
+                MigrationManager._setup_done.add(setup_key)
+            
+            alembic_ini_path = self.migrations_dir / "alembic.ini"
+            
+            # Setup Alembic config
+            self.alembic_cfg = Config(str(alembic_ini_path))
+            self.alembic_cfg.set_main_option("script_location", str(self.migrations_dir))
+            self.alembic_cfg.set_main_option("sqlalchemy.url", self.config.DATABASE_URL)
+            
+            # Reused across calls; rebuilt only when this manager adds revisions
+            self._script_dir = ScriptDirectory.from_config(self.alembic_cfg)
+            
+            logger.info("Alembic configuration setup completed")
+            
+        except Exception as e:
+            logger.error("Failed to setup Alembic: %s", e)
+            raise
+    
+    def _check_env_py_hook(self):
+        """
+        Warn if migrations/env.py ignores config.attributes["connection"]
+        
+        An env.py generated before that hook existed is never overwritten and
+        opens its own connection, so a shared connection would go unused.
+        """
+        env_py = self.migrations_dir / "env.py"
+        source = env_py.read_text()
+        if 'attributes.get("connection")' not in source and 'attributes["connection"]' not in source:
+            logger.warning(
+                "%s does not read config.attributes['connection']; migration commands "
+                "will open their own connection. Delete it to regenerate.", env_py
+            )
+    
+    def _create_alembic_ini(self):
+        """Create alembic.ini configuration file"""
+        _atomic_write(self.migrations_dir / "alembic.ini", _ALEMBIC_INI)
+    
+    def _create_env_py(self):
+        """Create env.py migration environment file"""
+        _atomic_write(self.migrations_dir / "env.py", _ENV_PY)
+    
+    def init_migrations(self, conn: Optional[Connection] = None) -> bool:
+        """
+        Initialize migration repository
+        
+        Only files are written, so conn is accepted for a uniform chain
+        interface but not used.
+        """
         try:
             if not self.db_manager._initialized:
                 self.db_manager.initialize()
                 
             # Check if already initialized
             versions_dir = self.migrations_dir / "versions"
-            if versions_dir.exists() and list(versions_dir.glob("*.py")):
+            if versions_dir.exists() and any(p.suffix == ".py" for p in versions_dir.iterdir()):
                 logger.info("Migration repository already initialized")
                 return True
             
             # Initialize Alembic
             command.init(self.alembic_cfg, str(self.migrations_dir))
+            self._script_dir = ScriptDirectory.from_config(self.alembic_cfg)
             logger.info("Migration repository initialized")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize migrations: {e}")
+            logger.error("Failed to initialize migrations: %s", e)
             return False
     
     def create_backup(self) -> Optional[str]:
         """Create database backup before migration"""
         try:
-            if not self.config.DATABASE_URL.startswith("sqlite"):
+            if self._url.get_backend_name() != "sqlite":
                 logger.info("Backup not implemented for non-SQLite databases")
                 return None
             
             # For SQLite, copy the database file
-            db_path = self.config.DATABASE_URL.replace("sqlite:///", "")
-            if not os.path.exists(db_path):
-                logger.warning(f"Database file not found: {db_path}")
+            db_path = self._url.database
+            if not db_path or not os.path.exists(db_path):
+                logger.warning("Database file not found: %s", db_path)
                 return None
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_filename = f"backup_{timestamp}.db"
             backup_path = self.backups_dir / backup_filename
             
-            shutil.copy2(db_path, backup_path)
-            logger.info(f"Database backup created: {backup_path}")
+            if self.db_manager.engine is not None:
+                self._snapshot_sqlite(db_path, backup_path)
+            else:
+                _fast_file_copy(db_path, backup_path)
+            
+            if self.config.BACKUP_COMPRESS and ZSTD_AVAILABLE:
+                backup_path = _compress_backup(backup_path)
+            logger.info("Database backup created: %s", backup_path)
             return str(backup_path)
             
         except Exception as e:
-            logger.error(f"Failed to create backup: {e}")
+            logger.error("Failed to create backup: %s", e)
             return None
     
+    def _snapshot_sqlite(self, db_path: str, backup_path: Path) -> None:
+        """
+        Write a consistent copy of the live SQLite database
+        
+        Uses the online backup API in steps of DB_BACKUP_PAGES pages (1024 pages
+        is about 4 MiB at the default page size), releasing the source lock
+        between steps so other connections keep working while the copy runs.
+        With DB_BACKUP_PAGES=0 it uses VACUUM INTO instead (SQLite 3.27+),
+        which writes a compacted file but holds the read lock throughout.
+        """
+        pages = self.config.BACKUP_PAGES
+        src = sqlite3.connect(db_path)
+        try:
+            if pages <= 0 and sqlite3.sqlite_version_info >= (3, 27, 0):
+                src.execute("VACUUM INTO ?", (str(backup_path),))
+                return
+            
+            dest = sqlite3.connect(str(backup_path))
+            try:
+                src.backup(
+                    dest,
+                    pages=pages if pages > 0 else -1,
+                    progress=lambda status, remaining, total: logger.debug(
+                        "Backup progress: %d/%d pages", total - remaining, total
+                    ),
+                )
+            finally:
+                dest.close()
+        finally:
+            src.close()
+    
     def restore_backup(self, backup_path: str) -> bool:
         """Restore database from backup"""
         try:
-            if not self.config.DATABASE_URL.startswith("sqlite"):
+            if self._url.get_backend_name() != "sqlite":
                 logger.error("Restore not implemented for non-SQLite databases")
                 return False
             
-            db_path = self.config.DATABASE_URL.replace("sqlite:///", "")
+            db_path = self._url.database
+            if not db_path or db_path == ":memory:":
+                logger.error("Restore requires a file-backed SQLite database")
+                return False
             
             if not os.path.exists(backup_path):
-                logger.error(f"Backup file not found: {backup_path}")
+                logger.error("Backup file not found: %s", backup_path)
+                return False
+            
+            compressed = str(backup_path).endswith(".zst")
+            if compressed and not ZSTD_AVAILABLE:
+                logger.error("zstandard is required to restore compressed backup: %s", backup_path)
                 return False
             
             # Close all connections
@@ -328,18 +552,65 @@ else:
                 self.db_manager.engine.dispose()
             
             # Restore backup
-            shutil.copy2(backup_path, db_path)
-            logger.info(f"Database restored from backup: {backup_path}")
+            if compressed:
+                _decompress_backup(backup_path, db_path)
+            else:
+                _fast_file_copy(backup_path, db_path)
+            logger.info("Database restored from backup: %s", backup_path)
             
             # Reinitialize database
             return self.db_manager.initialize()
             
         except Exception as e:
-            logger.error(f"Failed to restore backup: {e}")
+            logger.error("Failed to restore backup: %s", e)
             return False
     
-    def generate_migration(self, message: str, autogenerate: bool = True) -> Optional[str]:
-        """Generate a new migration"""
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """
+        List backup files, newest first
+        
+        Uses os.scandir so each entry's stat comes from the directory listing
+        rather than a separate stat() call per file.
+        """
+        try:
+            with os.scandir(self.backups_dir) as entries:
+                backups = []
+                for entry in entries:
+                    if entry.name.startswith("backup_") and entry.is_file():
+                        stat = entry.stat()
+                        backups.append({
+                            "name": entry.name,
+                            "path": entry.path,
+                            "modified": stat.st_mtime,
+                            "size": stat.st_size,
+                        })
+        except FileNotFoundError:
+            return []
+        
+        backups.sort(key=lambda backup: backup["modified"], reverse=True)
+        return backups
+    
+    def prune_backups(self, keep: int = 10) -> int:
+        """Delete all but the newest `keep` backups; returns how many were removed"""
+        removed = 0
+        for backup in self.list_backups()[max(keep, 0):]:
+            try:
+                os.unlink(backup["path"])
+                removed += 1
+            except OSError as e:
+                logger.warning("Failed to remove backup %s: %s", backup["path"], e)
+        
+        if removed:
+            logger.info("Pruned %d old backups", removed)
+        return removed
+    
+    def generate_migration(
+        self,
+        message: str,
+        autogenerate: bool = True,
+        conn: Optional[Connection] = None
+    ) -> Optional[str]:
+        """Generate a new migration, autogenerating against conn if given"""
         try:
             if not self.db_manager._initialized:
                 self.db_manager.initialize()
@@ -348,49 +619,107 @@ else:
             if self.config.BACKUP_BEFORE_MIGRATE:
                 backup_path = self.create_backup()
                 if backup_path:
-                    logger.info(f"Backup created before migration: {backup_path}")
+                    logger.info("Backup created before migration: %s", backup_path)
             
             # Generate migration
-            if autogenerate:
-                command.revision(self.alembic_cfg, message=message, autogenerate=True)
-            else:
+            if not autogenerate:
                 command.revision(self.alembic_cfg, message=message)
+            elif conn is None:
+                with self.connect() as own_conn:
+                    self._run_command(command.revision, own_conn, message=message, autogenerate=True)
+            else:
+                self._run_command(command.revision, conn, message=message, autogenerate=True)
             
-            logger.info(f"Migration generated: {message}")
+            logger.info("Migration generated: %s", message)
             
-            # Get the latest revision
-            script_dir = ScriptDirectory.from_config(self.alembic_cfg)
-            latest_revision = script_dir.get_current_head()
+            # Pick up the new revision file, then get the latest revision
+            self._script_dir = ScriptDirectory.from_config(self.alembic_cfg)
+            latest_revision = self._script_dir.get_current_head()
             
             return latest_revision
             
         except Exception as e:
-            logger.error(f"Failed to generate migration: {e}")
+            logger.error("Failed to generate migration: %s", e)
             return None
     
-    def migrate(self, revision: str = "head") -> bool:
-        """Run migrations to specified revision"""
+    @functools.cached_property
+    def migration_engine(self) -> Engine:
+        """
+        Engine for migration work, separate from the application pool
+        
+        Uses NullPool: migration checks are rare and short, so they shouldn't
+        hold an application pool slot or contend with its checkouts while
+        DDL runs. In-memory SQLite exists only on the application engine's
+        single connection, so that engine is used as is.
+        """
+        if self.db_manager._is_sqlite_memory():
+            if not self.db_manager._initialized:
+                self.db_manager.initialize()
+            return self.db_manager.engine
+        
+        return create_engine(
+            self.db_manager._get_engine_url(),
+            connect_args=self.db_manager._get_connect_args(),
+            poolclass=NullPool,
+        )
+    
+    def connect(self) -> Connection:
+        """Open a connection that can be shared across several migration calls"""
+        return self.migration_engine.connect()
+    
+    def _run_command(self, alembic_command: Callable, conn: Connection, *args, **kwargs) -> None:
+        """Run an Alembic command on conn, handed to env.py through config.attributes"""
+        self.alembic_cfg.attributes["connection"] = conn
+        try:
+            alembic_command(self.alembic_cfg, *args, **kwargs)
+            conn.commit()
+        finally:
+            self.alembic_cfg.attributes.pop("connection", None)
+    
+    def migrate(self, revision: str = "head", conn: Optional[Connection] = None) -> bool:
+        """Run migrations to specified revision, optionally on an existing connection"""
         try:
             if not self.db_manager._initialized:
                 self.db_manager.initialize()
             
-            # Create backup if enabled
-            if self.config.BACKUP_BEFORE_MIGRATE:
-                backup_path = self.create_backup()
-                if backup_path:
-                    logger.info(f"Backup created before migration: {backup_path}")
+            # The backup runs on a worker thread while the revision map loads and
+            # the current revision is read; no DDL starts until it has finished
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                backup_future = (
+                    pool.submit(self.create_backup)
+                    if self.config.BACKUP_BEFORE_MIGRATE else None
+                )
+                up_to_date = revision in ("head", "heads") and self._is_at_head(conn)
+                
+                if backup_future is not None:
+                    backup_path = backup_future.result()
+                    if backup_path:
+                        logger.info("Backup created before migration: %s", backup_path)
+            
+            if up_to_date:
+                logger.info("Database already at revision: %s", revision)
+                return True
             
             # Run migration
-            command.upgrade(self.alembic_cfg, revision)
-            logger.info(f"Migration completed to revision: {revision}")
+            if conn is None:
+                with self.connect() as own_conn:
+                    self._run_command(command.upgrade, own_conn, revision)
+            else:
+                self._run_command(command.upgrade, conn, revision)
+            logger.info("Migration completed to revision: %s", revision)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to run migration: {e}")
+            logger.error("Failed to run migration: %s", e)
             return False
     
-    def rollback(self, revision: str) -> bool:
-        """Rollback to specified revision"""
+    def _is_at_head(self, conn: Optional[Connection] = None) -> bool:
+        """Whether the database is already at the single head revision"""
+        current_revision = self.get_current_revision(conn)
+        return current_revision is not None and self._script_dir.get_heads() == [current_revision]
+    
+    def rollback(self, revision: str, conn: Optional[Connection] = None) -> bool:
+        """Rollback to specified revision, optionally on an existing connection"""
         try:
             if not self.db_manager._initialized:
                 self.db_manager.initialize()
@@ -398,111 +727,221 @@ else:
             # Create backup before rollback
             backup_path = self.create_backup()
             if backup_path:
-                logger.info(f"Backup created before rollback: {backup_path}")
+                logger.info("Backup created before rollback: %s", backup_path)
             
             # Perform rollback
-            command.downgrade(self.alembic_cfg, revision)
-            logger.info(f"Rollback completed to revision: {revision}")
+            if conn is None:
+                with self.connect() as own_conn:
+                    self._run_command(command.downgrade, own_conn, revision)
+            else:
+                self._run_command(command.downgrade, conn, revision)
+            logger.info("Rollback completed to revision: %s", revision)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to rollback: {e}")
+            logger.error("Failed to rollback: %s", e)
             return False
     
-    def get_current_revision(self) -> Optional[str]:
+    @staticmethod
+    def run_paginated_data_migration(
+        table: Table,
+        transform_fn: Callable[[Any], Optional[Dict[str, Any]]],
+        batch_size: int = 1000
+    ) -> int:
+        """
+        Apply a row-by-row data migration in bounded pages from a migration's upgrade()
+        
+        Rows are read in primary-key order one page at a time (keyset
+        pagination, so no cursor has to survive a commit) and each page's
+        updates run in an autocommit block. Locks are held per page instead of
+        for the whole table, and an interrupted run keeps finished pages.
+        
+        Args:
+            table: Table to migrate (must have a primary key)
+            transform_fn: Called with each row; returns the column values to
+                update, or None to leave the row unchanged
+            batch_size: Rows per page
+            
+        Returns:
+            Number of rows updated
+        """
+        bind = op.get_bind()
+        migration_context = op.get_context()
+        pk_cols = list(table.primary_key.columns)
+        if not pk_cols:
+            raise ValueError(f"Table {table.name} has no primary key")
+        
+        updated = 0
+        last_row = None
+        while True:
+            page = select(table).order_by(*pk_cols).limit(batch_size)
+            if last_row is not None:
+                # Row-value comparison continues after the last key seen
+                if len(pk_cols) == 1:
+                    page = page.where(pk_cols[0] > last_row[pk_cols[0]])
+                else:
+                    page = page.where(
+                        tuple_(*pk_cols) > tuple_(*(last_row[col] for col in pk_cols))
+                    )
+            
+            rows = [row._mapping for row in bind.execute(page)]
+            if not rows:
+                break
+            
+            # Group rows by the set of columns they change so each group is one executemany
+            params_by_columns = defaultdict(list)
+            for row in rows:
+                values = transform_fn(row)
+                if values:
+                    params = {f"v_{name}": value for name, value in values.items()}
+                    params.update({f"pk_{col.name}": row[col] for col in pk_cols})
+                    params_by_columns[tuple(sorted(values))].append(params)
+            
+            with migration_context.autocommit_block():
+                for columns, params in params_by_columns.items():
+                    statement = (
+                        update(table)
+                        .where(*(col == bindparam(f"pk_{col.name}") for col in pk_cols))
+                        .values({name: bindparam(f"v_{name}") for name in columns})
+                    )
+                    bind.execute(statement, params)
+                    updated += len(params)
+            
+            last_row = rows[-1]
+            logger.info("Data migration on %s: %d rows updated so far", table.name, updated)
+        
+        return updated
+    
+    @staticmethod
+    @contextmanager
+    def batch_alter(table_name: str, **kwargs) -> Iterator[Any]:
+        """
+        Alter a table from a migration via op.batch_alter_table
+        
+        On SQLite this recreates the table (copy-and-move) since ALTER support
+        is limited; other backends run plain ALTER statements.
+        """
+        with op.batch_alter_table(table_name, **kwargs) as batch_op:
+            yield batch_op
+    
+    def get_current_revision(self, conn: Optional[Connection] = None) -> Optional[str]:
         """Get current database revision"""
         try:
-            if not self.db_manager._initialized:
-                self.db_manager.initialize()
+            if conn is not None:
+                return MigrationContext.configure(conn).get_current_revision()
             
-            with self.db_manager.engine.connect() as connection:
+            with self.connect() as connection:
                 context = MigrationContext.configure(connection)
                 return context.get_current_revision()
                 
         except Exception as e:
-            logger.error(f"Failed to get current revision: {e}")
+            logger.error("Failed to get current revision: %s", e)
             return None
     
-    def get_migration_history(self) -> List[Dict[str, Any]]:
-        """Get migration history"""
+    def get_migration_history(
+        self,
+        conn: Optional[Connection] = None,
+        current_revision: Any = _UNSET
+    ) -> List[Dict[str, Any]]:
+        """Get migration history; pass current_revision if already known to skip the lookup"""
         try:
-            script_dir = ScriptDirectory.from_config(self.alembic_cfg)
+            script_dir = self._script_dir
             revisions = []
             
+            if current_revision is _UNSET:
+                current_revision = self.get_current_revision(conn)
+            
             for revision in script_dir.walk_revisions():
                 revisions.append({
                     "revision": revision.revision,
                     "down_revision": revision.down_revision,
                     "doc": revision.doc,
                     "create_date": revision.create_date,
-                    "is_current": revision.revision == self.get_current_revision()
+                    "is_current": revision.revision == current_revision
                 })
             
             return revisions
             
         except Exception as e:
-            logger.error(f"Failed to get migration history: {e}")
+            logger.error("Failed to get migration history: %s", e)
             return []
     
-    def check_database_schema(self) -> Dict[str, Any]:
-        """Check database schema status"""
+    def check_database_schema(self, conn: Optional[Connection] = None) -> Dict[str, Any]:
+        """Check database schema status, optionally on an existing connection"""
         try:
-            if not self.db_manager._initialized:
-                self.db_manager.initialize()
-            
-            inspector = inspect(self.db_manager.engine)
-            
-            # Get current tables
-            tables = inspector.get_table_names()
-            
-            # Get current revision
-            current_revision = self.get_current_revision()
-            
-            # Get available migrations
-            migration_history = self.get_migration_history()
+            if conn is not None:
+                return self._schema_status(conn)
             
-            return {
-                "tables": tables,
-                "current_revision": current_revision,
-                "migration_count": len(migration_history),
-                "pending_migrations": [
-                    m for m in migration_history 
-                    if not m["is_current"] and m["revision"] != current_revision
-                ]
-            }
+            # One connection for every query of the status check
+            with self.connect() as connection:
+                return self._schema_status(connection)
             
         except Exception as e:
-            logger.error(f"Failed to check database schema: {e}")
+            logger.error("Failed to check database schema: %s", e)
             return {}
-
-# Global migration manager
-migration_manager = MigrationManager()
+    
+    def _schema_status(self, conn: Connection) -> Dict[str, Any]:
+        """Collect schema status using a single connection"""
+        # Get current tables
+        tables = inspect(conn).get_table_names()
+        
+        # A fresh database has no version table, so there is nothing to query
+        if "alembic_version" in tables:
+            current_revision = self.get_current_revision(conn)
+        else:
+            current_revision = None
+        
+        # Get available migrations
+        migration_history = self.get_migration_history(conn, current_revision)
+        
+        return {
+            "tables": tables,
+            "current_revision": current_revision,
+            "migration_count": len(migration_history),
+            "pending_migrations": [
+                m for m in migration_history 
+                if not m["is_current"] and m["revision"] != current_revision
+            ]
+        }
+
+# Global migration manager, created on first use
+@functools.cache
+def get_migration_manager() -> MigrationManager:
+    """Get the global migration manager instance"""
+    return MigrationManager()
+
+def __getattr__(name: str):
+    """Keep `migration_manager` importable without setting up Alembic at import"""
+    if name == "migration_manager":
+        return get_migration_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions
-def init_migrations() -> bool:
+def init_migrations(conn: Optional[Connection] = None) -> bool:
     """Initialize migration system"""
-    return migration_manager.init_migrations()
+    return get_migration_manager().init_migrations(conn)
 
-def create_migration(message: str) -> Optional[str]:
+def create_migration(message: str, conn: Optional[Connection] = None) -> Optional[str]:
     """Create a new migration"""
-    return migration_manager.generate_migration(message)
+    return get_migration_manager().generate_migration(message, conn=conn)
 
-def run_migrations() -> bool:
+def run_migrations(conn: Optional[Connection] = None) -> bool:
     """Run all pending migrations"""
-    return migration_manager.migrate()
+    return get_migration_manager().migrate(conn=conn)
 
-def rollback_migration(revision: str = "-1") -> bool:
+def rollback_migration(revision: str = "-1", conn: Optional[Connection] = None) -> bool:
     """Rollback to previous revision"""
-    return migration_manager.rollback(revision)
+    return get_migration_manager().rollback(revision, conn)
 
-def get_schema_status() -> Dict[str, Any]:
+def get_schema_status(conn: Optional[Connection] = None) -> Dict[str, Any]:
     """Get current schema status"""
-    return migration_manager.check_database_schema()
+    return get_migration_manager().check_database_schema(conn)
 
 # Export classes and functions
 __all__ = [
     'MigrationManager',
     'migration_manager',
+    'get_migration_manager',
     'init_migrations',
     'create_migration',
     'run_migrations',
@@ -0,0 +1,81 @@
+"""Store exercise_sessions.session_uuid as a native UUID
+
+Revision ID: 5d2c7a9e41b3
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+PostgreSQL converts the VARCHAR(36) column to uuid in place. Elsewhere the
+Uuid type binds 32-character hex, so dashed values written before the change
+are rewritten to that form or lookups by session_uuid would never match them.
+Databases created from the current models are left as they are.
+"""
+import uuid
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migrations import MigrationManager
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2c7a9e41b3'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+exercise_sessions = sa.Table(
+    "exercise_sessions", sa.MetaData(),
+    sa.Column("id", sa.BigInteger, primary_key=True),
+    sa.Column("session_uuid", sa.String(36)),
+)
+
+
+def _session_uuid_type():
+    """Reflected type of session_uuid, or None if the table doesn't exist yet"""
+    inspector = sa.inspect(op.get_bind())
+    if "exercise_sessions" not in inspector.get_table_names():
+        return None
+    columns = {column["name"]: column for column in inspector.get_columns("exercise_sessions")}
+    return columns["session_uuid"]["type"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    column_type = _session_uuid_type()
+    if column_type is None:
+        return
+    
+    if op.get_bind().dialect.name == "postgresql":
+        if not isinstance(column_type, sa.Uuid):
+            op.execute(
+                "ALTER TABLE exercise_sessions "
+                "ALTER COLUMN session_uuid TYPE uuid USING session_uuid::uuid"
+            )
+    else:
+        op.execute(
+            "UPDATE exercise_sessions SET session_uuid = replace(session_uuid, '-', '') "
+            "WHERE session_uuid LIKE '%-%'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    column_type = _session_uuid_type()
+    if column_type is None:
+        return
+    
+    if op.get_bind().dialect.name == "postgresql":
+        if isinstance(column_type, sa.Uuid):
+            op.execute(
+                "ALTER TABLE exercise_sessions "
+                "ALTER COLUMN session_uuid TYPE varchar(36) USING session_uuid::text"
+            )
+    else:
+        MigrationManager.run_paginated_data_migration(
+            exercise_sessions,
+            lambda row: (
+                {"session_uuid": str(uuid.UUID(row["session_uuid"]))}
+                if row["session_uuid"] and "-" not in row["session_uuid"] else None
+            )
+        )
@@ -0,0 +1,123 @@
+"""Split accelerometer and gyroscope JSON into per-axis REAL columns
+
+Revision ID: 8e4f1b6c2a90
+Revises: 5d2c7a9e41b3
+Create Date: 2026-10-17 09:30:00.000000
+
+Adds accel_x/y/z and gyro_x/y/z to muscle_activation_patterns, copies each
+{x, y, z} object (or [x, y, z] list) into them page by page, then drops the
+accelerometer_data and gyroscope_data columns. Columns that already exist, or
+are already gone, are skipped, so databases created from the current models
+pass through unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migrations import MigrationManager
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4f1b6c2a90'
+down_revision: Union[str, Sequence[str], None] = '5d2c7a9e41b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "muscle_activation_patterns"
+
+# JSON column -> prefix of its per-axis columns
+SENSORS = {"accelerometer_data": "accel", "gyroscope_data": "gyro"}
+AXES = ("x", "y", "z")
+
+
+def _existing_columns() -> set:
+    """Column names of the table, or an empty set if it doesn't exist yet"""
+    inspector = sa.inspect(op.get_bind())
+    if TABLE not in inspector.get_table_names():
+        return set()
+    return {column["name"] for column in inspector.get_columns(TABLE)}
+
+
+def _table(json_columns, axis_columns) -> sa.Table:
+    """Lightweight table with just the columns a data migration touches"""
+    return sa.Table(
+        TABLE, sa.MetaData(),
+        sa.Column("id", sa.BigInteger, primary_key=True),
+        *(sa.Column(name, sa.JSON) for name in json_columns),
+        *(sa.Column(name, sa.REAL) for name in axis_columns),
+    )
+
+
+def _axis_values(reading) -> tuple:
+    """(x, y, z) from a stored reading, with None for anything missing"""
+    if isinstance(reading, dict):
+        return tuple(reading.get(axis) for axis in AXES)
+    if isinstance(reading, (list, tuple)) and len(reading) == len(AXES):
+        return tuple(reading)
+    return (None,) * len(AXES)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = _existing_columns()
+    if not existing:
+        return
+    
+    axis_columns = [f"{prefix}_{axis}" for prefix in SENSORS.values() for axis in AXES]
+    missing = [name for name in axis_columns if name not in existing]
+    if missing:
+        with MigrationManager.batch_alter(TABLE) as batch_op:
+            for name in missing:
+                batch_op.add_column(sa.Column(name, sa.REAL))
+    
+    legacy = [name for name in SENSORS if name in existing]
+    if not legacy:
+        return
+    
+    def split(row):
+        values = {}
+        for json_column in legacy:
+            if row[json_column] is not None:
+                for axis, value in zip(AXES, _axis_values(row[json_column])):
+                    values[f"{SENSORS[json_column]}_{axis}"] = value
+        return values or None
+    
+    MigrationManager.run_paginated_data_migration(_table(legacy, axis_columns), split)
+    
+    with MigrationManager.batch_alter(TABLE) as batch_op:
+        for name in legacy:
+            batch_op.drop_column(name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = _existing_columns()
+    if not existing:
+        return
+    
+    with MigrationManager.batch_alter(TABLE) as batch_op:
+        for name in SENSORS:
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, sa.JSON))
+    
+    axis_columns = [
+        f"{prefix}_{axis}" for prefix in SENSORS.values() for axis in AXES
+        if f"{prefix}_{axis}" in existing
+    ]
+    if not axis_columns:
+        return
+    
+    def join(row):
+        values = {}
+        for json_column, prefix in SENSORS.items():
+            reading = {axis: row.get(f"{prefix}_{axis}") for axis in AXES}
+            if any(value is not None for value in reading.values()):
+                values[json_column] = reading
+        return values or None
+    
+    MigrationManager.run_paginated_data_migration(_table(SENSORS, axis_columns), join)
+    
+    with MigrationManager.batch_alter(TABLE) as batch_op:
+        for name in axis_columns:
+            batch_op.drop_column(name)
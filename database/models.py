@@ -4,19 +4,59 @@ SQLAlchemy models for the full CoreSense platform including user profiles, exerc
 progress tracking, AI coaching, subscriptions, muscle activation patterns, and achievements.
 """
 
+import functools
+import os
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, Text, Float, ForeignKey, 
-    Enum as SQLEnum, JSON, BigInteger, Numeric, Index, UniqueConstraint
+    Enum as SQLEnum, JSON, BigInteger, Identity, Numeric, REAL, Index, UniqueConstraint, Uuid,
+    TypeDecorator, and_, or_, func, text, event
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy.dialects.postgresql import UUID
 import enum
 from typing import Optional, Dict, Any
 import uuid
 
-Base = declarative_base()
+class _ModelBase:
+    # Read server-filled columns (the func.now() timestamps) back right after
+    # each INSERT and UPDATE, so they stay loaded instead of expired and can be
+    # used after the session closes. Uses RETURNING where the backend has it.
+    __mapper_args__ = {"eager_defaults": True}
+
+Base = declarative_base(cls=_ModelBase)
+
+# Range-partition muscle activation samples by month on PostgreSQL. A partitioned
+# table needs the partition key in its primary key, and SQLite can't autoincrement
+# a composite key, so this is opt-in (DB_PARTITION_SENSOR_DATA=true).
+PARTITION_SENSOR_DATA = os.getenv("DB_PARTITION_SENSOR_DATA", "false").lower() == "true"
+
+# 64-bit keys for high-volume tables. SQLite only autoincrements INTEGER PRIMARY
+# KEY (already 64-bit there), so it keeps that type; it also ignores Identity.
+# The identity sequences cache values per backend to skip most nextval() work.
+BIG_ID = BigInteger().with_variant(Integer, "sqlite")
+
+class UTCDateTime(TypeDecorator):
+    """
+    DateTime(timezone=True) that is timezone-aware on every backend
+    
+    SQLite keeps no offset and its CURRENT_TIMESTAMP is UTC, so values are
+    stored there as UTC and read back tagged with timezone.utc.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None and dialect.name == "sqlite":
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
 
 # Enumerations
 class UserRole(enum.Enum):
@@ -75,7 +115,32 @@ class AchievementType(enum.Enum):
     MILESTONE = "milestone"
     SPECIAL = "special"
 
+def _named_enum(enum_class, name: str) -> SQLEnum:
+    """
+    Enum column type with a pinned type name
+    
+    PostgreSQL gets a native ENUM (CREATE TYPE <name>), stored as 4 bytes and
+    compared by sort order; other databases fall back to VARCHAR. Labels stay
+    the member names ('ACTIVE'), which existing rows and auth/models.py (same
+    users table) use.
+    """
+    return SQLEnum(enum_class, name=name)
+
+# Shared enum column types; one type per enum so columns reuse a single CREATE TYPE.
+# The names are the ones SQLAlchemy derived from the class names, so databases
+# created before they were pinned keep working without a migration.
+USER_ROLE_ENUM = _named_enum(UserRole, "userrole")
+FITNESS_LEVEL_ENUM = _named_enum(FitnessLevel, "fitnesslevel")
+EXERCISE_TYPE_ENUM = _named_enum(ExerciseType, "exercisetype")
+SESSION_STATUS_ENUM = _named_enum(SessionStatus, "sessionstatus")
+SUBSCRIPTION_STATUS_ENUM = _named_enum(SubscriptionStatus, "subscriptionstatus")
+PAYMENT_STATUS_ENUM = _named_enum(PaymentStatus, "paymentstatus")
+ACHIEVEMENT_TYPE_ENUM = _named_enum(AchievementType, "achievementtype")
+
 # Core Models
+# Timestamps are filled by the database (server_default=func.now(), and now() in
+# the UPDATE's SET clause for onupdate), so bulk inserts and updates build no
+# Python datetimes per row. eager_defaults on the base reads them back.
 class User(Base):
     """Enhanced user model with comprehensive profile management"""
     __tablename__ = "users"
@@ -91,18 +156,18 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     
     # Role-based access control
-    role = Column(SQLEnum(UserRole), default=UserRole.FREE)
+    role = Column(USER_ROLE_ENUM, default=UserRole.FREE)
     
     # Personal information
     first_name = Column(String(100))
     last_name = Column(String(100))
-    date_of_birth = Column(DateTime(timezone=True))
+    date_of_birth = Column(UTCDateTime())
     gender = Column(String(20))
     height_cm = Column(Integer)
     weight_kg = Column(Float)
     
     # Fitness profile
-    fitness_level = Column(SQLEnum(FitnessLevel), default=FitnessLevel.BEGINNER)
+    fitness_level = Column(FITNESS_LEVEL_ENUM, default=FitnessLevel.BEGINNER)
     training_goals = Column(JSON)  # Structured goals data
     preferred_session_duration = Column(Integer, default=30)  # minutes
     weekly_training_frequency = Column(Integer, default=3)
@@ -114,30 +179,30 @@ class User(Base):
     coaching_preferences = Column(JSON)  # AI coaching style, feedback frequency
     
     # Account management
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-    last_login = Column(DateTime(timezone=True))
-    last_activity = Column(DateTime(timezone=True))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), server_default=func.now(), onupdate=func.now())
+    last_login = Column(UTCDateTime())
+    last_activity = Column(UTCDateTime())
     
     # Premium features
-    premium_expires_at = Column(DateTime(timezone=True))
-    subscription_status = Column(SQLEnum(SubscriptionStatus), default=SubscriptionStatus.FREE)
+    premium_expires_at = Column(UTCDateTime())
+    subscription_status = Column(SUBSCRIPTION_STATUS_ENUM, default=SubscriptionStatus.FREE)
     
     # Relationships
-    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
-    exercise_sessions = relationship("ExerciseSession", back_populates="user", cascade="all, delete-orphan")
-    progress_records = relationship("ProgressRecord", back_populates="user", cascade="all, delete-orphan")
-    ai_coaching_sessions = relationship("AICoachingSession", back_populates="user", cascade="all, delete-orphan")
-    subscriptions = relationship("Subscription", back_populates="user", cascade="all, delete-orphan")
-    muscle_activation_data = relationship("MuscleActivationPattern", back_populates="user", cascade="all, delete-orphan")
-    achievements = relationship("UserAchievement", back_populates="user", cascade="all, delete-orphan")
+    sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    exercise_sessions = relationship("ExerciseSession", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    progress_records = relationship("ProgressRecord", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    ai_coaching_sessions = relationship("AICoachingSession", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    subscriptions = relationship("Subscription", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    muscle_activation_data = relationship("MuscleActivationPattern", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
+    achievements = relationship("UserAchievement", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
     
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', role='{self.role.value}')>"
     
-    @property
+    @functools.cached_property
     def full_name(self) -> str:
-        """Get user's full name"""
+        """Get user's full name (cached until a name column changes or the row is refreshed)"""
         if self.first_name and self.last_name:
             return f"{self.first_name} {self.last_name}"
         elif self.first_name:
@@ -145,23 +210,50 @@ class User(Base):
         else:
             return self.username
     
-    @property
+    @hybrid_property
     def is_premium(self) -> bool:
         """Check if user has active premium subscription"""
+        return self.is_premium_at(datetime.now(timezone.utc))
+    
+    @is_premium.expression
+    def is_premium(cls):
+        """SQL form of is_premium, so filters run in the database (and can use idx_user_premium_expiry)"""
+        return or_(
+            cls.role == UserRole.ADMIN,
+            and_(
+                cls.subscription_status == SubscriptionStatus.ACTIVE,
+                cls.premium_expires_at > func.now()
+            )
+        )
+    
+    def is_premium_at(self, now: datetime) -> bool:
+        """Check premium status at a given time; pass one `now` when checking many users"""
         if self.role == UserRole.ADMIN:
             return True
         if self.subscription_status == SubscriptionStatus.ACTIVE and self.premium_expires_at:
-            return datetime.now(timezone.utc) < self.premium_expires_at
+            return now < self.premium_expires_at
         return False
     
     @property
     def age(self) -> Optional[int]:
         """Calculate user's age from date of birth"""
+        return self.age_at(datetime.now(timezone.utc))
+    
+    def age_at(self, today: datetime) -> Optional[int]:
+        """Calculate user's age on a given date; pass one `today` when checking many users"""
         if self.date_of_birth:
-            today = datetime.now(timezone.utc)
             return today.year - self.date_of_birth.year - ((today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day))
         return None
 
+def _reset_full_name(target, *args):
+    """Drop the cached User.full_name"""
+    target.__dict__.pop("full_name", None)
+
+for _name_attribute in (User.first_name, User.last_name, User.username):
+    event.listen(_name_attribute, "set", _reset_full_name)
+event.listen(User, "expire", _reset_full_name)
+event.listen(User, "refresh", _reset_full_name)
+
 class UserSession(Base):
     """User session model for JWT token management and session tracking"""
     __tablename__ = "user_sessions"
@@ -180,34 +272,39 @@ class UserSession(Base):
     location = Column(JSON)  # Geolocation data
     
     # Session lifecycle
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    expires_at = Column(DateTime(timezone=True), nullable=False)
-    last_accessed = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    expires_at = Column(UTCDateTime(), nullable=False)
+    last_accessed = Column(UTCDateTime(), server_default=func.now())
     
     # Session status
     is_active = Column(Boolean, default=True)
-    logged_out_at = Column(DateTime(timezone=True))
+    logged_out_at = Column(UTCDateTime())
     
     # Relationships
-    user = relationship("User", back_populates="sessions")
+    user = relationship("User", back_populates="sessions", lazy="raise_on_sql")
     
     @property
     def is_expired(self) -> bool:
         """Check if session is expired"""
-        return datetime.now(timezone.utc) > self.expires_at
+        return self.is_expired_at(datetime.now(timezone.utc))
+    
+    def is_expired_at(self, now: datetime) -> bool:
+        """Check expiry at a given time; pass one `now` when checking many sessions"""
+        return now > self.expires_at
 
 class ExerciseSession(Base):
     """Comprehensive exercise session model with muscle activation data"""
     __tablename__ = "exercise_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BIG_ID, Identity(start=1, cache=100), primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Session identification
-    session_uuid = Column(String(36), unique=True, default=lambda: str(uuid.uuid4()))
+    # Native 16-byte UUID on PostgreSQL, CHAR(32) elsewhere; read and written as str
+    session_uuid = Column(Uuid(as_uuid=False), unique=True, default=lambda: str(uuid.uuid4()))
     
     # Session details
-    exercise_type = Column(SQLEnum(ExerciseType), nullable=False)
+    exercise_type = Column(EXERCISE_TYPE_ENUM, nullable=False)
     session_name = Column(String(200))
     description = Column(Text)
     difficulty_level = Column(Integer, default=1)  # 1-10 scale
@@ -215,8 +312,8 @@ class ExerciseSession(Base):
     # Timing
     planned_duration_seconds = Column(Integer)
     actual_duration_seconds = Column(Integer)
-    started_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    completed_at = Column(DateTime(timezone=True))
+    started_at = Column(UTCDateTime(), server_default=func.now())
+    completed_at = Column(UTCDateTime())
     
     # Performance metrics
     stability_score = Column(Float)  # 0-100 scale
@@ -230,7 +327,7 @@ class ExerciseSession(Base):
     muscle_engagement_level = Column(Float)
     
     # Session status and outcome
-    status = Column(SQLEnum(SessionStatus), default=SessionStatus.PLANNED)
+    status = Column(SESSION_STATUS_ENUM, default=SessionStatus.PLANNED)
     completion_percentage = Column(Float, default=0.0)
     
     # Data storage
@@ -244,13 +341,13 @@ class ExerciseSession(Base):
     calories_burned = Column(Integer)
     
     # Session metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="exercise_sessions")
-    muscle_activations = relationship("MuscleActivationPattern", back_populates="exercise_session", cascade="all, delete-orphan")
-    ai_feedback = relationship("AICoachingSession", back_populates="exercise_session", cascade="all, delete-orphan")
+    user = relationship("User", back_populates="exercise_sessions", lazy="raise_on_sql")
+    muscle_activations = relationship("MuscleActivationPattern", back_populates="exercise_session", cascade="all, delete-orphan", lazy="raise_on_sql")
+    ai_feedback = relationship("AICoachingSession", back_populates="exercise_session", cascade="all, delete-orphan", lazy="raise_on_sql")
     
     @property
     def duration_minutes(self) -> float:
@@ -267,7 +364,7 @@ class ProgressRecord(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Record identification
-    record_date = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    record_date = Column(UTCDateTime(), server_default=func.now())
     record_type = Column(String(50))  # weekly, monthly, milestone, custom
     
     # Performance metrics
@@ -303,19 +400,19 @@ class ProgressRecord(Base):
     difficulty_progression = Column(JSON)  # Difficulty level over time
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
     notes = Column(Text)
     
     # Relationships
-    user = relationship("User", back_populates="progress_records")
+    user = relationship("User", back_populates="progress_records", lazy="raise_on_sql")
 
 class AICoachingSession(Base):
     """AI coaching history and recommendations model"""
     __tablename__ = "ai_coaching_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BIG_ID, Identity(start=1, cache=100), primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    exercise_session_id = Column(Integer, ForeignKey("exercise_sessions.id"))
+    exercise_session_id = Column(BIG_ID, ForeignKey("exercise_sessions.id"))
     
     # Coaching session details
     coaching_type = Column(String(50))  # real_time, post_session, weekly_review, goal_setting
@@ -341,17 +438,17 @@ class AICoachingSession(Base):
     next_session_impact = Column(Float)  # Impact on next session performance
     
     # Timing
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    delivered_at = Column(DateTime(timezone=True))
-    acknowledged_at = Column(DateTime(timezone=True))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    delivered_at = Column(UTCDateTime())
+    acknowledged_at = Column(UTCDateTime())
     
     # AI model information
     model_version = Column(String(50))
     processing_time_ms = Column(Integer)
     
     # Relationships
-    user = relationship("User", back_populates="ai_coaching_sessions")
-    exercise_session = relationship("ExerciseSession", back_populates="ai_feedback")
+    user = relationship("User", back_populates="ai_coaching_sessions", lazy="raise_on_sql")
+    exercise_session = relationship("ExerciseSession", back_populates="ai_feedback", lazy="raise_on_sql")
 
 class Subscription(Base):
     """Subscription and billing management model"""
@@ -370,19 +467,19 @@ class Subscription(Base):
     discount_applied = Column(Numeric(10, 2), default=0)
     
     # Subscription lifecycle
-    status = Column(SQLEnum(SubscriptionStatus), default=SubscriptionStatus.PENDING)
-    started_at = Column(DateTime(timezone=True))
-    expires_at = Column(DateTime(timezone=True))
-    cancelled_at = Column(DateTime(timezone=True))
+    status = Column(SUBSCRIPTION_STATUS_ENUM, default=SubscriptionStatus.PENDING)
+    started_at = Column(UTCDateTime())
+    expires_at = Column(UTCDateTime())
+    cancelled_at = Column(UTCDateTime())
     
     # Payment information
     payment_method_id = Column(String(100))  # External payment provider ID
-    last_payment_date = Column(DateTime(timezone=True))
-    next_billing_date = Column(DateTime(timezone=True))
+    last_payment_date = Column(UTCDateTime())
+    next_billing_date = Column(UTCDateTime())
     
     # Trial information
     is_trial = Column(Boolean, default=False)
-    trial_expires_at = Column(DateTime(timezone=True))
+    trial_expires_at = Column(UTCDateTime())
     trial_used = Column(Boolean, default=False)
     
     # Subscription features
@@ -391,18 +488,18 @@ class Subscription(Base):
     current_usage = Column(JSON)  # Current period usage
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), onupdate=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="subscriptions")
-    payments = relationship("Payment", back_populates="subscription", cascade="all, delete-orphan")
+    user = relationship("User", back_populates="subscriptions", lazy="raise_on_sql")
+    payments = relationship("Payment", back_populates="subscription", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 class Payment(Base):
     """Payment transaction model for billing"""
     __tablename__ = "payments"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BIG_ID, Identity(start=1, cache=100), primary_key=True, index=True)
     subscription_id = Column(Integer, ForeignKey("subscriptions.id"), nullable=False)
     
     # Payment identification
@@ -415,8 +512,8 @@ class Payment(Base):
     payment_method = Column(String(50))  # credit_card, paypal, bank_transfer
     
     # Payment status
-    status = Column(SQLEnum(PaymentStatus), default=PaymentStatus.PENDING)
-    payment_date = Column(DateTime(timezone=True))
+    status = Column(PAYMENT_STATUS_ENUM, default=PaymentStatus.PENDING)
+    payment_date = Column(UTCDateTime())
     
     # Payment provider information
     provider_name = Column(String(50))  # stripe, paypal, etc.
@@ -431,25 +528,32 @@ class Payment(Base):
     # Refund information
     refunded_amount = Column(Numeric(10, 2), default=0)
     refund_reason = Column(String(200))
-    refunded_at = Column(DateTime(timezone=True))
+    refunded_at = Column(UTCDateTime())
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), onupdate=func.now())
     
     # Relationships
-    subscription = relationship("Subscription", back_populates="payments")
+    subscription = relationship("Subscription", back_populates="payments", lazy="raise_on_sql")
 
 class MuscleActivationPattern(Base):
     """Time-series muscle activation data model"""
     __tablename__ = "muscle_activation_patterns"
+    # Indexes declared on the partitioned parent are created locally on every partition
+    __table_args__ = (
+        {'postgresql_partition_by': 'RANGE (timestamp)'} if PARTITION_SENSOR_DATA else {}
+    )
     
-    id = Column(BigInteger, primary_key=True, index=True)
+    id = Column(BIG_ID, Identity(start=1, cache=1000), primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    exercise_session_id = Column(Integer, ForeignKey("exercise_sessions.id"), nullable=False)
+    exercise_session_id = Column(BIG_ID, ForeignKey("exercise_sessions.id"), nullable=False)
     
-    # Timing
-    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Timing; part of the primary key (id, timestamp) when partitioned
+    timestamp = Column(
+        UTCDateTime(), server_default=func.now(),
+        primary_key=PARTITION_SENSOR_DATA
+    )
     session_time_offset_ms = Column(Integer)  # Milliseconds from session start
     
     # Muscle group data
@@ -460,8 +564,14 @@ class MuscleActivationPattern(Base):
     shoulder_activation = Column(Float)
     
     # Sensor readings
-    accelerometer_data = Column(JSON)  # x, y, z accelerometer readings
-    gyroscope_data = Column(JSON)  # x, y, z gyroscope readings
+    # One fixed-width column per axis rather than a JSON object per sample, so
+    # aggregates over many samples run as plain float scans in the database
+    accel_x = Column(REAL)  # Accelerometer readings
+    accel_y = Column(REAL)
+    accel_z = Column(REAL)
+    gyro_x = Column(REAL)  # Gyroscope readings
+    gyro_y = Column(REAL)
+    gyro_z = Column(REAL)
     pressure_data = Column(JSON)  # Pressure sensor readings
     
     # Stability metrics
@@ -484,8 +594,8 @@ class MuscleActivationPattern(Base):
     data_confidence = Column(Float)  # Confidence in the measurements
     
     # Relationships
-    user = relationship("User", back_populates="muscle_activation_data")
-    exercise_session = relationship("ExerciseSession", back_populates="muscle_activations")
+    user = relationship("User", back_populates="muscle_activation_data", lazy="raise_on_sql")
+    exercise_session = relationship("ExerciseSession", back_populates="muscle_activations", lazy="raise_on_sql")
 
 class Achievement(Base):
     """Achievement definitions and templates"""
@@ -496,7 +606,7 @@ class Achievement(Base):
     # Achievement details
     name = Column(String(100), unique=True, nullable=False)
     description = Column(Text, nullable=False)
-    type = Column(SQLEnum(AchievementType), nullable=False)
+    type = Column(ACHIEVEMENT_TYPE_ENUM, nullable=False)
     
     # Achievement criteria
     criteria = Column(JSON, nullable=False)  # Structured criteria for earning
@@ -517,31 +627,31 @@ class Achievement(Base):
     sort_order = Column(Integer, default=0)
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
+    updated_at = Column(UTCDateTime(), onupdate=func.now())
     
     # Relationships
-    user_achievements = relationship("UserAchievement", back_populates="achievement", cascade="all, delete-orphan")
+    user_achievements = relationship("UserAchievement", back_populates="achievement", cascade="all, delete-orphan", lazy="raise_on_sql")
 
 class UserAchievement(Base):
     """User's earned achievements and milestones"""
     __tablename__ = "user_achievements"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BIG_ID, Identity(start=1, cache=100), primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     achievement_id = Column(Integer, ForeignKey("achievements.id"), nullable=False)
     
     # Achievement earning details
-    earned_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    earned_at = Column(UTCDateTime(), server_default=func.now())
     progress_when_earned = Column(JSON)  # User's stats when achievement was earned
     
     # Achievement context
-    triggering_session_id = Column(Integer, ForeignKey("exercise_sessions.id"))
+    triggering_session_id = Column(BIG_ID, ForeignKey("exercise_sessions.id"))
     milestone_value = Column(Float)  # The specific value that triggered the achievement
     
     # Display and notification
     is_acknowledged = Column(Boolean, default=False)
-    acknowledged_at = Column(DateTime(timezone=True))
+    acknowledged_at = Column(UTCDateTime())
     is_featured = Column(Boolean, default=False)  # Featured on profile
     
     # Social features
@@ -549,7 +659,7 @@ class UserAchievement(Base):
     share_count = Column(Integer, default=0)
     
     # Metadata
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at = Column(UTCDateTime(), server_default=func.now())
     
     # Constraints
     __table_args__ = (
@@ -557,25 +667,58 @@ class UserAchievement(Base):
     )
     
     # Relationships
-    user = relationship("User", back_populates="achievements")
-    achievement = relationship("Achievement", back_populates="user_achievements")
+    user = relationship("User", back_populates="achievements", lazy="raise_on_sql")
+    achievement = relationship("Achievement", back_populates="user_achievements", lazy="raise_on_sql")
+
+# Relationships never lazy-load (lazy="raise_on_sql"), so each query states what
+# it needs: selectinload for collections (one IN query per level), joinedload
+# for many-to-one. Loader options for the common user profile view:
+USER_PROFILE_LOAD = (
+    selectinload(User.subscriptions).selectinload(Subscription.payments),
+    selectinload(User.achievements).joinedload(UserAchievement.achievement),
+)
+
+def _active_index(name: str, column, is_active) -> Index:
+    """
+    Partial index over active rows only
+    
+    Nearly every row is active, so is_active as a key column prunes nothing;
+    as a predicate it keeps the index to the rows the hot paths look up.
+    """
+    return Index(
+        name, column,
+        postgresql_where=is_active.is_(True),
+        sqlite_where=is_active.is_(True)
+    )
 
 # Create comprehensive indexes for optimal performance
-Index('idx_user_email_active', User.email, User.is_active)
-Index('idx_user_username_active', User.username, User.is_active)
+# (email, username and session_token lookups use their unique column indexes)
 Index('idx_user_subscription_status', User.subscription_status)
-Index('idx_user_role_active', User.role, User.is_active)
+# Partial index for "active premium, expiring before X" lookups; the time
+# check stays in the query because index predicates must be immutable
+Index(
+    'idx_user_premium_expiry', User.premium_expires_at,
+    postgresql_where=text("subscription_status = 'ACTIVE'"),
+    sqlite_where=text("subscription_status = 'ACTIVE'")
+)
+_active_index('idx_user_role_active', User.role, User.is_active)
 
-Index('idx_session_token_active', UserSession.session_token, UserSession.is_active)
-Index('idx_session_user_active', UserSession.user_id, UserSession.is_active)
+_active_index('idx_session_user_active', UserSession.user_id, UserSession.is_active)
 Index('idx_session_expires', UserSession.expires_at)
 
-Index('idx_exercise_session_user_date', ExerciseSession.user_id, ExerciseSession.started_at)
+# INCLUDE columns make the per-user list views index-only scans on PostgreSQL
+Index(
+    'idx_exercise_session_user_date', ExerciseSession.user_id, ExerciseSession.started_at.desc(),
+    postgresql_include=['exercise_type', 'status', 'overall_score', 'actual_duration_seconds']
+)
 Index('idx_exercise_session_type_status', ExerciseSession.exercise_type, ExerciseSession.status)
 Index('idx_exercise_session_completion', ExerciseSession.completed_at)
 Index('idx_exercise_session_uuid', ExerciseSession.session_uuid)
 
-Index('idx_progress_user_date', ProgressRecord.user_id, ProgressRecord.record_date)
+Index(
+    'idx_progress_user_date', ProgressRecord.user_id, ProgressRecord.record_date,
+    postgresql_include=['average_stability_score', 'average_form_quality', 'streak_days']
+)
 Index('idx_progress_type_date', ProgressRecord.record_type, ProgressRecord.record_date)
 
 Index('idx_ai_coaching_user_date', AICoachingSession.user_id, AICoachingSession.created_at)
@@ -597,5 +740,8 @@ Index('idx_achievement_type_active', Achievement.type, Achievement.is_active)
 Index('idx_achievement_category', Achievement.category)
 
 Index('idx_user_achievement_user', UserAchievement.user_id)
-Index('idx_user_achievement_earned_date', UserAchievement.earned_at)
+Index(
+    'idx_user_achievement_earned_date', UserAchievement.earned_at,
+    postgresql_include=['achievement_id', 'is_featured']
+)
 Index('idx_user_achievement_acknowledged', UserAchievement.is_acknowledged)
\ No newline at end of file
@@ -14,7 +14,7 @@ from .models import (
     UserRole, FitnessLevel, ExerciseType, SessionStatus,
     SubscriptionStatus, PaymentStatus, AchievementType
 )
-from .database import db_service
+from .database import get_db_service
 
 class SampleDataGenerator:
     """Generate sample data for CoreSense database"""
@@ -221,7 +221,7 @@ class SampleDataGenerator:
             users_data = self.generate_sample_users(user_count)
             user_ids = []
             
-            with db_service.session_scope() as session:
+            with get_db_service().session_scope() as session:
                 for user_data in users_data:
                     user = User(**user_data)
                     session.add(user)
@@ -283,7 +283,7 @@ def populate_sample_data(user_count: int = 10, sessions_per_user: int = 20) -> b
 def clear_all_data() -> bool:
     """Clear all data from database (use with caution!)"""
     try:
-        with db_service.session_scope() as session:
+        with get_db_service().session_scope() as session:
             # Delete in reverse order of dependencies
             session.query(UserAchievement).delete()
             session.query(Achievement).delete()
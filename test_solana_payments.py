@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Solana Payment Verification Test Script
+CoreSense Premium Features - Payment Safety Checks
+
+Tests that a blockchain hash can only pay for one transaction and that a
+transfer only verifies the transaction named in its memo.
+"""
+
+import asyncio
+import sys
+import os
+
+# Add project root to path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(project_root)
+
+def fake_rpc(service, memo: str, lamports: int):
+    """Build an _rpc replacement returning one finalized transfer to the treasury"""
+    async def _rpc(method, params):
+        if method == "getSignatureStatuses":
+            return {"value": [{"err": None, "confirmationStatus": "finalized"}]}
+        return {
+            "slot": 285432109,
+            "meta": {
+                "err": None,
+                "preBalances": [5 * lamports, 0],
+                "postBalances": [4 * lamports, lamports],
+                "innerInstructions": []
+            },
+            "transaction": {"message": {
+                "accountKeys": [
+                    {"pubkey": "PayerWalletPublicKey"},
+                    {"pubkey": service.treasury_wallet.public_key}
+                ],
+                "instructions": [
+                    {"program": "system", "parsed": {"type": "transfer"}},
+                    {"program": "spl-memo", "parsed": memo}
+                ]
+            }}
+        }
+    return _rpc
+
+async def test_hash_replay_rejected():
+    """Test that a hash already used for one transaction can't confirm another"""
+    print("🔁 Testing blockchain hash replay...")
+
+    try:
+        from coral_integration.solana_payments import SolanaPaymentService
+
+        service = SolanaPaymentService()
+        first = await service.create_payment_request("user_1", "basic", "UserWallet1")
+        second = await service.create_payment_request("user_2", "basic", "UserWallet2")
+
+        result = await service.verify_payment(first["transaction_id"], "sig_replayed")
+        if not result["success"]:
+            print(f"   ❌ First verification failed: {result}")
+            return False
+        print("   ✓ First transaction verified")
+
+        result = await service.verify_payment(second["transaction_id"], "sig_replayed")
+        if result["success"]:
+            print("   ❌ Same hash activated a second subscription")
+            return False
+        print(f"   ✓ Replay rejected: {result['error']}")
+
+        status = await service.check_subscription_status("user_2")
+        if status["subscription"] is not None:
+            print("   ❌ Replayed hash left an active subscription behind")
+            return False
+        print("   ✓ No subscription for the replaying user")
+
+        return True
+
+    except Exception as e:
+        print(f"   ❌ Hash replay test failed: {e}")
+        return False
+
+async def test_memo_must_match_transaction():
+    """Test that a transfer only verifies the transaction named in its memo"""
+    print("\n📝 Testing payment memo matching...")
+
+    try:
+        from coral_integration import solana_payments
+        from coral_integration.solana_payments import SolanaPaymentService, LAMPORTS_PER_SOL
+
+        service = SolanaPaymentService()
+        request = await service.create_payment_request("user_3", "pro", "UserWallet3")
+        other = await service.create_payment_request("user_4", "pro", "UserWallet4")
+        lamports = round(service.payment_plans["pro"].price_sol * LAMPORTS_PER_SOL)
+
+        rpc_url = solana_payments.SOLANA_RPC_URL
+        solana_payments.SOLANA_RPC_URL = "http://solana-rpc.test"
+        try:
+            # Enough SOL reached the treasury, but the memo names another transaction
+            service._rpc = fake_rpc(service, f"CoreSense-{other['transaction_id']}", lamports)
+            result = await service.verify_payment(request["transaction_id"], "sig_wrong_memo")
+            if result["success"]:
+                print("   ❌ Transfer with another transaction's memo was accepted")
+                return False
+            print("   ✓ Mismatched memo rejected")
+
+            service._rpc = fake_rpc(service, request["payment_details"]["memo"], lamports)
+            result = await service.verify_payment(request["transaction_id"], "sig_right_memo")
+            if not result["success"]:
+                print(f"   ❌ Transfer with the matching memo was rejected: {result}")
+                return False
+            print("   ✓ Matching memo verified")
+        finally:
+            solana_payments.SOLANA_RPC_URL = rpc_url
+
+        return True
+
+    except Exception as e:
+        print(f"   ❌ Memo matching test failed: {e}")
+        return False
+
+async def main():
+    """Run all payment verification tests"""
+    print("🚀 Starting Solana Payment Tests")
+    print("=" * 50)
+
+    tests = [
+        ("Hash Replay", test_hash_replay_rejected),
+        ("Memo Matching", test_memo_must_match_transaction)
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = await test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"❌ {test_name} failed with error: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    print("\n" + "=" * 50)
+    print("📊 Test Results Summary")
+
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "✅ PASSED" if result else "❌ FAILED"
+        print(f"   {test_name}: {status}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+
+    return passed == total
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)